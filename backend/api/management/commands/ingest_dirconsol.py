@@ -1,3 +1,4 @@
+import functools
 import os
 import pandas as pd
 from django.core.management.base import BaseCommand
@@ -7,136 +8,303 @@ from datetime import datetime, timedelta
 
 # Utility functions for normalization
 
-def normalize_headers(headers):
-    seen = {}
-    result = []
-    for h in headers:
-        if h not in seen:
-            seen[h] = 1
-            result.append(h)
-        else:
-            seen[h] += 1
-            result.append(f"{h}__{seen[h]}")
-    return result
-
 def parse_money(val):
-    if pd.isna(val) or val == '':
+    if val is None or val == '':
         return None
     try:
         return float(str(val).replace(',', ''))
     except Exception:
         return None
 
-def parse_date(val):
-    if pd.isna(val) or val == '':
+def parse_excel_serial(val):
+    # Scalar fallback for Excel serial dates ("45123") that the vectorized
+    # format='mixed' parse rejects; everything else stays NaT.
+    try:
+        return datetime(1899, 12, 30) + timedelta(days=int(float(val)))
+    except Exception:
         return None
-    # Excel serial
-    if isinstance(val, (int, float)):
-        try:
-            return datetime(1899, 12, 30) + timedelta(days=int(val))
-        except Exception:
-            return None
-    # String date (prioritize datetime and date formats)
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y", "%d-%m-%Y", "%d/%m/%Y"):
-        try:
-            return datetime.strptime(str(val), fmt)
-        except Exception:
-            continue
-    return None
 
+@functools.lru_cache(maxsize=None)
 def fy_label_from_date(dt):
     if not dt:
         return None
     return f"FY{dt.year}"
 
+def cell(row, i):
+    """Positional cell access for itertuples rows; None when the column is absent."""
+    return row[i] if i is not None else None
+
+def iter_keyed_batches(items, batch_size=10000):
+    """
+    Group (key, obj) pairs into de-duplicated batches of at most batch_size,
+    so the flush loop holds O(batch_size) model instances instead of O(rows).
+    """
+    buf = {}
+    for key, obj in items:
+        buf[key] = obj
+        if len(buf) >= batch_size:
+            yield list(buf.values())
+            buf.clear()
+    if buf:
+        yield list(buf.values())
+
+def make_remun_builder(ridx):
+    """
+    Specialize a DirectorRemuneration constructor for one year slot: the
+    slot's column indexes are bound as closure locals once, so the row loop
+    does positional reads instead of per-field dict lookups.
+    """
+    basic_i = ridx['basic_salary']
+    pf_i = ridx['pf']
+    perqs_i = ridx['perqs']
+    bonus_i = ridx['bonus']
+    pay_excl_i = ridx['pay_excl_esops']
+    esops_i = ridx['esops']
+    total_i = ridx['total_remuneration']
+    options_i = ridx['options_granted']
+    status_i = ridx['remuneration_status']
+    comments_i = ridx['comments']
+
+    def build(row, company_id, director, fy_end):
+        return DirectorRemuneration(
+            company_id=company_id,
+            director=director,
+            fy_end_date=fy_end,
+            fy_label=fy_label_from_date(fy_end),
+            basic_salary=cell(row, basic_i),
+            pf=cell(row, pf_i),
+            perqs=cell(row, perqs_i),
+            bonus=cell(row, bonus_i),
+            pay_excl_esops=cell(row, pay_excl_i),
+            esops=cell(row, esops_i),
+            total_remuneration=cell(row, total_i),
+            options_granted=cell(row, options_i),
+            remuneration_status=cell(row, status_i),
+            comments=cell(row, comments_i),
+        )
+
+    return build
+
+def make_fin_builder(fidx):
+    """Specialize a CompanyFinancialTimeSeries constructor for one year slot."""
+    total_income_i = fidx['total_income']
+    pat_i = fidx['pat']
+    roa_i = fidx['roa']
+    employee_cost_i = fidx['employee_cost']
+    mcap_i = fidx['mcap']
+
+    def build(row, company_id, fy_end):
+        return CompanyFinancialTimeSeries(
+            company_id=company_id,
+            fy_end_date=fy_end,
+            fy_label=fy_label_from_date(fy_end),
+            total_income=cell(row, total_income_i),
+            pat=cell(row, pat_i),
+            roa=cell(row, roa_i),
+            employee_cost=cell(row, employee_cost_i),
+            mcap=cell(row, mcap_i),
+            employees=None,  # No of employees is not year-specific in your columns
+        )
+
+    return build
+
+# Columns converted vectorized before the row loop
+MONEY_COLS = [
+    f'Year {slot} {label}' for slot in range(1, 6) for label in (
+        'Basic Salary', 'PF/Retirement', 'Perquisites/Allowances', 'Bonus / Commission',
+        'Pay (Excl ESOPS)', 'ESOPS', 'Total Remuneration', 'Options Granted',
+        'Total Income', 'PAT', 'ROA', 'Employee Cost', 'MCAP',
+    )
+]
+DATE_COLS = ['Appointment Date'] + [f'Year {slot}' for slot in range(1, 6)] \
+    + [f'Year {slot}.1' for slot in range(1, 6)]
+
+# Per-slot column-name tables built once at import, so the row loop does
+# plain dict lookups instead of rebuilding ~15 f-strings per row.
+REMUN_SLOT_COLS = [
+    {
+        'date': f'Year {slot}',
+        'basic_salary': f'Year {slot} Basic Salary',
+        'pf': f'Year {slot} PF/Retirement',
+        'perqs': f'Year {slot} Perquisites/Allowances',
+        'bonus': f'Year {slot} Bonus / Commission',
+        'pay_excl_esops': f'Year {slot} Pay (Excl ESOPS)',
+        'esops': f'Year {slot} ESOPS',
+        'total_remuneration': f'Year {slot} Total Remuneration',
+        'options_granted': f'Year {slot} Options Granted',
+        'remuneration_status': f'Year {slot} Remuneration Status',
+        'comments': f'Year {slot} Comments',
+    }
+    for slot in range(1, 6)
+]
+FIN_SLOT_COLS = [
+    {
+        'date': f'Year {slot}.1',
+        'total_income': f'Year {slot} Total Income',
+        'pat': f'Year {slot} PAT',
+        'roa': f'Year {slot} ROA',
+        'employee_cost': f'Year {slot} Employee Cost',
+        'mcap': f'Year {slot} MCAP',
+    }
+    for slot in range(1, 6)
+]
+
 class Command(BaseCommand):
     help = 'Ingest and normalize Dir Consol Excel sheet into DB.'
 
     def add_arguments(self, parser):
         parser.add_argument('excel_path', type=str, help='Path to Excel file')
 
+    # Fields refreshed on conflict when re-ingesting an existing (company, director, fy) row
+    REMUN_UPDATE_FIELDS = [
+        'fy_label', 'basic_salary', 'pf', 'perqs', 'bonus', 'pay_excl_esops',
+        'esops', 'total_remuneration', 'options_granted', 'remuneration_status', 'comments',
+    ]
+    FIN_UPDATE_FIELDS = ['fy_label', 'total_income', 'pat', 'roa', 'employee_cost', 'mcap', 'employees']
+
     @transaction.atomic
     def handle(self, *args, **options):
         excel_path = options['excel_path']
-        df = pd.read_excel(excel_path, sheet_name='Dir Consol', dtype=str)
-        df.columns = normalize_headers(df.columns)
-        
-        for idx, row in df.iterrows():
-            if idx < 5:
-                print(f"Row {idx} - Company: {row.get('Company Name')}, Director: {row.get('Director Name')}")
-            # --- Company ---
-            # --- Company ---
-            company_id = row.get('BSE Scrip Code') or row.get('Company ID') or row.get('Company Name')
+        df = pd.read_excel(excel_path, sheet_name='Dir Consol', dtype=str, engine='calamine')
+        # pandas' own dedup ('col', 'col.1', ...) matches the 'Year {slot}.1'
+        # convention used below, so no custom header pass is needed
+        df.columns = pd.io.common.dedup_names(df.columns, is_potential_multiindex=False)
+
+        # Convert money/date columns in one vectorized pass each;
+        # parse_money/parse_date remain as scalar fallbacks for rejected cells.
+        for col in MONEY_COLS:
+            if col not in df.columns:
+                continue
+            raw = df[col]
+            converted = pd.to_numeric(raw.str.replace(',', '', regex=False), errors='coerce')
+            rejected = converted.isna() & raw.notna()
+            if rejected.any():
+                converted[rejected] = pd.to_numeric(raw[rejected].map(parse_money), errors='coerce')
+            df[col] = converted
+        for col in DATE_COLS:
+            if col not in df.columns:
+                continue
+            raw = df[col]
+            converted = pd.to_datetime(raw, errors='coerce', format='mixed')
+            rejected = converted.isna() & raw.notna()
+            if rejected.any():
+                converted[rejected] = pd.to_datetime(raw[rejected].map(parse_excel_serial), errors='coerce')
+            df[col] = converted
+
+        # Replace NaN/NaT with None column-wise, once (astype(object) first,
+        # or datetime64 columns would coerce the None straight back to NaT);
+        # missing-value tests in the loops below become pointer compares.
+        df = df.astype(object).where(df.notna(), None)
+
+        # Positional handles so the loop can iterate plain tuples instead of
+        # allocating a pd.Series per row with iterrows().
+        col_idx = {name: i for i, name in enumerate(df.columns)}
+        remun_idx = [{field: col_idx.get(col) for field, col in slot.items()} for slot in REMUN_SLOT_COLS]
+        fin_idx = [{field: col_idx.get(col) for field, col in slot.items()} for slot in FIN_SLOT_COLS]
+        remun_date_is = [r['date'] for r in remun_idx]
+        fin_date_is = [f['date'] for f in fin_idx]
+        remun_builders = [make_remun_builder(r) for r in remun_idx]
+        fin_builders = [make_fin_builder(f) for f in fin_idx]
+        bse_i = col_idx.get('BSE Scrip Code')
+        company_id_i = col_idx.get('Company ID')
+        company_name_i = col_idx.get('Company Name')
+        director_name_i = col_idx.get('Director Name')
+        din_i = col_idx.get('DIN')
+        sector_i = col_idx.get('Sector')
+        industry_i = col_idx.get('Industry')
+        index_i = col_idx.get('Index')
+        appointment_i = col_idx.get('Appointment Date')
+
+        def company_key(row):
+            return cell(row, bse_i) or cell(row, company_id_i) or cell(row, company_name_i)
+
+        def director_key(row, company_id):
+            return cell(row, din_i) or f"{company_id}_{cell(row, director_name_i) or ''}_{cell(row, appointment_i) or ''}"
+
+        # Pass 1: entities only. These maps are O(unique companies/directors),
+        # not O(rows x slots), so they are the only collections kept whole.
+        companies = {}
+        directors = {}
+        for row in df.itertuples(index=False, name=None):
+            company_id = company_key(row)
             if not company_id:
                 continue
-            company, _ = Company.objects.get_or_create(
-                company_id=company_id,
-                defaults={
-                    'name': row.get('Company Name', ''),
-                    'sector': row.get('Sector', ''),
-                    'industry': row.get('Industry', ''),
-                    'index': row.get('Index', ''),
-                }
+            if company_id not in companies:
+                companies[company_id] = Company(
+                    company_id=company_id,
+                    name=cell(row, company_name_i) or '',
+                    sector=cell(row, sector_i) or '',
+                    industry=cell(row, industry_i) or '',
+                    index=cell(row, index_i) or '',
+                )
+            director_id = director_key(row, company_id)
+            if director_id not in directors:
+                directors[director_id] = Director(
+                    director_id=director_id,
+                    name=cell(row, director_name_i) or '',
+                    appointment_date=cell(row, appointment_i),
+                    company_id=company_id,
+                )
+
+        # Flush entities first (existing rows are left untouched, as with get_or_create)
+        Company.objects.bulk_create(companies.values(), batch_size=10000, ignore_conflicts=True)
+        Director.objects.bulk_create(directors.values(), batch_size=10000, ignore_conflicts=True)
+
+        # Re-select directors to obtain PKs for FK assignment
+        directors_map = {}
+        for d in Director.objects.filter(director_id__in=directors):
+            directors_map.setdefault(d.director_id, d)
+
+        # Pass 2: time-series rows as generators, flushed in bounded chunks so
+        # peak memory stays O(batch) instead of holding every row until commit.
+        def iter_remunerations():
+            for row in df.itertuples(index=False, name=None):
+                company_id = company_key(row)
+                if not company_id:
+                    continue
+                director = directors_map.get(director_key(row, company_id))
+                if director is None:
+                    continue
+                for slot in range(5):
+                    fy_end = cell(row, remun_date_is[slot])
+                    if not fy_end:
+                        continue
+                    yield (company_id, director.pk, fy_end), \
+                        remun_builders[slot](row, company_id, director, fy_end)
+
+        def iter_financials():
+            for row in df.itertuples(index=False, name=None):
+                company_id = company_key(row)
+                if not company_id:
+                    continue
+                for slot in range(5):
+                    fy_end = cell(row, fin_date_is[slot])
+                    if not fy_end:
+                        continue
+                    yield (company_id, fy_end), fin_builders[slot](row, company_id, fy_end)
+
+        # Upsert time-series rows chunk by chunk (matches update_or_create semantics)
+        remun_count = 0
+        for batch in iter_keyed_batches(iter_remunerations()):
+            DirectorRemuneration.objects.bulk_create(
+                batch,
+                batch_size=10000,
+                update_conflicts=True,
+                unique_fields=['company', 'director', 'fy_end_date'],
+                update_fields=self.REMUN_UPDATE_FIELDS,
             )
-            # --- Director ---
-            director_id = row.get('DIN') or f"{company_id}_{row.get('Director Name','')}_{row.get('Appointment Date','')}"
-            director, _ = Director.objects.get_or_create(
-                director_id=director_id,
-                defaults={
-                    'name': row.get('Director Name', ''),
-                    'appointment_date': parse_date(row.get('Appointment Date', '')),
-                    'company': company
-                }
+            remun_count += len(batch)
+        fin_count = 0
+        for batch in iter_keyed_batches(iter_financials()):
+            CompanyFinancialTimeSeries.objects.bulk_create(
+                batch,
+                batch_size=10000,
+                update_conflicts=True,
+                unique_fields=['company', 'fy_end_date'],
+                update_fields=self.FIN_UPDATE_FIELDS,
             )
-            # --- For each year slot (1-5) ---
-            for slot in range(1, 6):
-                # Remuneration block
-                rem_date_val = row.get(f'Year {slot}')
-                if idx < 5:
-                    print(f"  Slot {slot} Remuneration date raw: {rem_date_val}")
-                fy_end = parse_date(rem_date_val)
-                if idx < 5:
-                    print(f"    Parsed Remuneration date: {fy_end}")
-                if fy_end:
-                    fy_label = fy_label_from_date(fy_end)
-                    DirectorRemuneration.objects.update_or_create(
-                        company=company,
-                        director=director,
-                        fy_end_date=fy_end,
-                        defaults={
-                            'fy_label': fy_label,
-                            'basic_salary': parse_money(row.get(f'Year {slot} Basic Salary', None)),
-                            'pf': parse_money(row.get(f'Year {slot} PF/Retirement', None)),
-                            'perqs': parse_money(row.get(f'Year {slot} Perquisites/Allowances', None)),
-                            'bonus': parse_money(row.get(f'Year {slot} Bonus / Commission', None)),
-                            'pay_excl_esops': parse_money(row.get(f'Year {slot} Pay (Excl ESOPS)', None)),
-                            'esops': parse_money(row.get(f'Year {slot} ESOPS', None)),
-                            'total_remuneration': parse_money(row.get(f'Year {slot} Total Remuneration', None)),
-                            'options_granted': parse_money(row.get(f'Year {slot} Options Granted', None)),
-                            'remuneration_status': row.get(f'Year {slot} Remuneration Status', None),
-                            'comments': row.get(f'Year {slot} Comments', None),
-                        }
-                    )
-                # Financials block (note: year-end date is in Year {slot}.1)
-                fin_date_val = row.get(f'Year {slot}.1')
-                if idx < 5:
-                    print(f"  Slot {slot} Financials date raw: {fin_date_val}")
-                fy_end_fin = parse_date(fin_date_val)
-                if idx < 5:
-                    print(f"    Parsed Financials date: {fy_end_fin}")
-                if fy_end_fin:
-                    fy_label_fin = fy_label_from_date(fy_end_fin)
-                    CompanyFinancialTimeSeries.objects.update_or_create(
-                        company=company,
-                        fy_end_date=fy_end_fin,
-                        defaults={
-                            'fy_label': fy_label_fin,
-                            'total_income': parse_money(row.get(f'Year {slot} Total Income', None)),
-                            'pat': parse_money(row.get(f'Year {slot} PAT', None)),
-                            'roa': parse_money(row.get(f'Year {slot} ROA', None)),
-                            'employee_cost': parse_money(row.get(f'Year {slot} Employee Cost', None)),
-                            'mcap': parse_money(row.get(f'Year {slot} MCAP', None)),
-                            'employees': None,  # No of employees is not year-specific in your columns
-                        }
-                    )
-        self.stdout.write(self.style.SUCCESS('Ingestion complete.'))
+            fin_count += len(batch)
+        self.stdout.write(self.style.SUCCESS(
+            f'Ingestion complete: {len(companies)} companies, {len(directors)} directors, '
+            f'{remun_count} remuneration rows, {fin_count} financial rows.'
+        ))
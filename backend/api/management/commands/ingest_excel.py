@@ -2,69 +2,227 @@
 Django management command to ingest Excel data into the database.
 Usage: python manage.py ingest_excel
 """
+import functools
+import re
+
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from api.models import Company, Director, DirectorRemuneration, CompanyFinancialTimeSeries, PeerComparison
 
 
+# Numeric and date columns of the 'Dir Consol_DataPlay' sheet, converted
+# column-wise up front so the row loops only see floats/Timestamps/NaN.
+MONEY_SUFFIXES = (
+    'Basic Salary', 'PF/Retirement', 'Perquisites/Allowances', 'Bonus / Commission',
+    'Pay (Excl ESOPS)', 'ESOPS', 'Total Remuneration', 'Options Granted',
+    'Discount', 'Fair Value', 'Aggregate Value',
+    'Total Income', 'PAT', 'ROA', 'Employee Cost', 'MCAP',
+)
+MONEY_COLS = [f'Year {year} {suffix}' for year in range(1, 6) for suffix in MONEY_SUFFIXES]
+MONEY_COLS += ['Salary to med emp pay']
+DATE_COLS = [f'Year {year}' for year in range(1, 6)] + [f'Year {year}.1' for year in range(1, 6)]
+DATE_COLS += ['DOB', 'Appointment Date']
+
+# Per-year column-name tables built once at import, so the row loops do
+# plain dict lookups instead of rebuilding f-strings per row.
+REMUN_SLOT_COLS = [
+    {
+        'basic_salary': f'Year {year} Basic Salary',
+        'pf': f'Year {year} PF/Retirement',
+        'perqs': f'Year {year} Perquisites/Allowances',
+        'bonus': f'Year {year} Bonus / Commission',
+        'pay_excl_esops': f'Year {year} Pay (Excl ESOPS)',
+        'esops': f'Year {year} ESOPS',
+        'total_remuneration': f'Year {year} Total Remuneration',
+        'options_granted': f'Year {year} Options Granted',
+        'discount': f'Year {year} Discount',
+        'fair_value': f'Year {year} Fair Value',
+        'aggregate_value': f'Year {year} Aggregate Value',
+        'remuneration_status': f'Year {year} Remuneration Status',
+        'comments': f'Year {year} Comments',
+    }
+    for year in range(1, 6)
+]
+FIN_SLOT_COLS = [
+    {
+        'total_income': f'Year {year} Total Income',
+        'pat': f'Year {year} PAT',
+        'roa': f'Year {year} ROA',
+        'employee_cost': f'Year {year} Employee Cost',
+        'mcap': f'Year {year} MCAP',
+    }
+    for year in range(1, 6)
+]
+
+
+@functools.lru_cache(maxsize=None)
 def get_fiscal_year_label(date_obj):
     """Convert date to fiscal year label (e.g., FY2024)"""
-    if pd.isna(date_obj):
+    if date_obj is None:
         return None
     if isinstance(date_obj, str):
         return date_obj
     return f"FY{date_obj.year}"
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(date_val):
+    """Parse a date string; cached since the same strings repeat across rows"""
+    try:
+        return pd.to_datetime(date_val).date()
+    except Exception:
+        return None
+
+
 def parse_date(date_val):
-    """Parse date values from Excel"""
-    if pd.isna(date_val):
+    """Parse date values from Excel (NaN cells arrive as None after masking)"""
+    if date_val is None:
         return None
     if isinstance(date_val, datetime):
         return date_val.date()
+    if isinstance(date_val, str):
+        return _parse_date_str(date_val)
     try:
         return pd.to_datetime(date_val).date()
     except:
         return None
 
 
+# Strips anything that cannot be part of a number (currency symbols, spaces, commas)
+_NON_NUMERIC_RE = re.compile(r'[^0-9.\-]')
+
+
 def safe_float(value):
     """Safely convert value to float, handling malformed data"""
     if pd.isna(value):
         return None
     if isinstance(value, (int, float)):
         return float(value)
-    
+
     try:
         return float(value)
     except (ValueError, TypeError):
-        # Handle common formatting issues
         if isinstance(value, str):
-            # Remove extra decimal points (e.g., "12.88.800" -> "12.88800" -> try different approaches)
-            # Count dots to identify the issue
-            dot_count = value.count('.')
-            if dot_count > 1:
-                # Try keeping only the first decimal point
-                parts = value.split('.')
-                # Join all parts except the first with nothing (remove dots)
-                cleaned = parts[0] + '.' + ''.join(parts[1:])
-                try:
-                    return float(cleaned)
-                except (ValueError, TypeError):
-                    pass
-            
-            # Try removing all non-numeric characters except decimal point
-            cleaned = ''.join(c for c in value if c.isdigit() or c == '.')
+            # One compiled-regex pass removes formatting junk; extra decimal
+            # points (e.g. "12.88.800" -> "12.88800") keep the first dot only
+            cleaned = _NON_NUMERIC_RE.sub('', value)
+            head, dot, tail = cleaned.partition('.')
+            if dot:
+                cleaned = head + '.' + tail.replace('.', '')
             try:
                 return float(cleaned)
             except (ValueError, TypeError):
                 pass
-        
+
         return None
 
 
+def cell(row, i):
+    """Positional cell access for itertuples rows; None when the column is absent."""
+    return row[i] if i is not None else None
+
+
+def make_remun_builder(ridx):
+    """
+    Specialize a DirectorRemuneration constructor for one year slot.
+
+    The slot's column indexes are bound as closure locals once, so the row
+    loop constructs records with plain positional reads instead of resolving
+    the ridx dict per field per row.
+    """
+    basic_i = ridx['basic_salary']
+    pf_i = ridx['pf']
+    perqs_i = ridx['perqs']
+    bonus_i = ridx['bonus']
+    pay_excl_i = ridx['pay_excl_esops']
+    esops_i = ridx['esops']
+    total_i = ridx['total_remuneration']
+    options_i = ridx['options_granted']
+    discount_i = ridx['discount']
+    fair_value_i = ridx['fair_value']
+    aggregate_i = ridx['aggregate_value']
+    status_i = ridx['remuneration_status']
+    comments_i = ridx['comments']
+
+    def build(row, company, director, fy_end_date):
+        remuneration_status = cell(row, status_i)
+        comments = cell(row, comments_i)
+        return DirectorRemuneration(
+            company=company,
+            director=director,
+            fy_end_date=fy_end_date,
+            fy_label=get_fiscal_year_label(fy_end_date),
+            basic_salary=cell(row, basic_i),
+            pf=cell(row, pf_i),
+            perqs=cell(row, perqs_i),
+            bonus=cell(row, bonus_i),
+            pay_excl_esops=cell(row, pay_excl_i),
+            esops=cell(row, esops_i),
+            total_remuneration=cell(row, total_i),
+            options_granted=cell(row, options_i),
+            discount=cell(row, discount_i),
+            fair_value=cell(row, fair_value_i),
+            aggregate_value=cell(row, aggregate_i),
+            remuneration_status=None if remuneration_status is None else str(remuneration_status),
+            comments=None if comments is None else str(comments),
+        )
+
+    return build
+
+
+def make_fin_builder(fidx):
+    """Specialize a CompanyFinancialTimeSeries constructor for one year slot."""
+    total_income_i = fidx['total_income']
+    pat_i = fidx['pat']
+    roa_i = fidx['roa']
+    employee_cost_i = fidx['employee_cost']
+    mcap_i = fidx['mcap']
+
+    def build(row, company, fy_end_date):
+        return CompanyFinancialTimeSeries(
+            company=company,
+            fy_end_date=fy_end_date,
+            fy_label=get_fiscal_year_label(fy_end_date),
+            total_income=cell(row, total_income_i),
+            pat=cell(row, pat_i),
+            roa=cell(row, roa_i),
+            employee_cost=cell(row, employee_cost_i),
+            mcap=cell(row, mcap_i),
+        )
+
+    return build
+
+
+def convert_columns(df):
+    """
+    Convert money and date columns in a single vectorized pass per column.
+
+    pd.to_numeric/pd.to_datetime run in C instead of per-cell Python calls;
+    safe_float is kept only as a scalar fallback for the few cells the
+    vectorized conversion rejects (e.g. "12.88.800").
+    """
+    for col in MONEY_COLS:
+        if col not in df.columns:
+            continue
+        raw = df[col]
+        converted = pd.to_numeric(
+            raw.astype(str).str.replace(',', '', regex=False), errors='coerce'
+        )
+        rejected = converted.isna() & raw.notna()
+        if rejected.any():
+            converted[rejected] = pd.to_numeric(raw[rejected].map(safe_float), errors='coerce')
+        df[col] = converted
+
+    for col in DATE_COLS:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+
+    return df
+
+
 class Command(BaseCommand):
     help = 'Ingest data from Excel file into the database'
 
@@ -76,61 +234,77 @@ class Command(BaseCommand):
             default=None
         )
 
-    def ingest_data(self, excel_path):
+    @transaction.atomic
+    def ingest_data(self, excel_path, verbosity=1):
         """
-        Ingest data from Excel file into database.
+        Ingest data from Excel file into database (single transaction).
         """
-        self.stdout.write(f"Reading Excel file from: {excel_path}")
+        if connection.vendor == 'postgresql':
+            # One fsync at commit instead of one per statement
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL synchronous_commit = OFF')
+
+        # Progress output honours --verbosity 0; errors are always written.
+        progress = self.stdout.write if verbosity else (lambda msg: None)
+
+        progress(f"Reading Excel file from: {excel_path}")
         
         # Read the main data sheet
-        df = pd.read_excel(excel_path, sheet_name='Dir Consol_DataPlay')
-        self.stdout.write(f"Loaded {len(df)} rows from Excel")
+        df = pd.read_excel(excel_path, sheet_name='Dir Consol_DataPlay', engine='calamine')
+        df = convert_columns(df)
+        # Replace NaN/NaT with None column-wise, once (astype(object) first,
+        # or datetime64 columns would coerce the None straight back to NaT).
+        # Every missing-value test below is then a pointer compare.
+        df = df.astype(object).where(df.notna(), None)
+        progress(f"Loaded {len(df)} rows from Excel")
+
+        # Positional column handles for tuple-based iteration over the frame
+        col_idx = {name: i for i, name in enumerate(df.columns)}
+        remun_idx = [{field: col_idx.get(col) for field, col in slot.items()} for slot in REMUN_SLOT_COLS]
+        fin_idx = [{field: col_idx.get(col) for field, col in slot.items()} for slot in FIN_SLOT_COLS]
+        din_i = col_idx.get('DIN')
+        bse_i = col_idx.get('BSE Scrip Code')
         
         # Get unique companies
         companies_data = df[['BSE Scrip Code', 'Company Name', 'Sector', 'Industry', 'Index', 'No of employees']].drop_duplicates()
         
-        self.stdout.write(self.style.SUCCESS("\n" + "="*60))
-        self.stdout.write(self.style.SUCCESS("Step 1: Creating Companies..."))
-        self.stdout.write(self.style.SUCCESS("="*60))
+        progress(self.style.SUCCESS("\n" + "="*60))
+        progress(self.style.SUCCESS("Step 1: Creating Companies..."))
+        progress(self.style.SUCCESS("="*60))
         
-        companies_map = {}
-        company_count = 0
-        for _, row in companies_data.iterrows():
-            company_id = str(row['BSE Scrip Code']).strip()
-            if pd.isna(company_id) or company_id == 'nan':
+        # Build all Company objects in memory and flush them with a single
+        # bulk_create instead of one get_or_create round-trip per row.
+        companies = {}
+        for bse_code, name, sector, industry, index, employees in companies_data.itertuples(index=False, name=None):
+            if bse_code is None:
+                continue
+            company_id = str(bse_code).strip()
+            if company_id in companies:
                 continue
-                
-            company_name = row['Company Name'] or 'Unknown'
-            sector = row['Sector'] if not pd.isna(row['Sector']) else None
-            industry = row['Industry'] if not pd.isna(row['Industry']) else None
-            index = row['Index'] if not pd.isna(row['Index']) else None
-            employees = int(row['No of employees']) if not pd.isna(row['No of employees']) and row['No of employees'] > 0 else None
-            
-            company, created = Company.objects.get_or_create(
+
+            employees = int(employees) if employees is not None and employees > 0 else None
+            companies[company_id] = Company(
                 company_id=company_id,
-                defaults={
-                    'name': company_name,
-                    'sector': sector,
-                    'industry': industry,
-                    'index': index,
-                    'employees': employees,
-                }
+                name=name or 'Unknown',
+                sector=sector,
+                industry=industry,
+                index=index,
+                employees=employees,
             )
-            
-            if created:
-                self.stdout.write(f"✓ Created company: {company_name} ({company_id})")
-                company_count += 1
-            else:
-                self.stdout.write(f"→ Already exists: {company_name} ({company_id})")
-                
-            companies_map[company_id] = company
-        
-        self.stdout.write(self.style.SUCCESS(f"\nTotal companies: {len(companies_map)}"))
+
+        # Three queries total regardless of sheet size: existing lookup,
+        # insert of the missing rows, and a final map refresh
+        existing = Company.objects.in_bulk(companies, field_name='company_id')
+        missing = [companies[cid] for cid in companies.keys() - existing.keys()]
+        Company.objects.bulk_create(missing, batch_size=10000, ignore_conflicts=True)
+        companies_map = Company.objects.in_bulk(companies, field_name='company_id')
+
+        progress(self.style.SUCCESS(f"\nTotal companies: {len(companies_map)}"))
         
         # Get unique directors
-        self.stdout.write(self.style.SUCCESS("\n" + "="*60))
-        self.stdout.write(self.style.SUCCESS("Step 2: Creating Directors..."))
-        self.stdout.write(self.style.SUCCESS("="*60))
+        progress(self.style.SUCCESS("\n" + "="*60))
+        progress(self.style.SUCCESS("Step 2: Creating Directors..."))
+        progress(self.style.SUCCESS("="*60))
         
         directors_data = df[[
             'DIN', 'Director Name', 'Company Name', 'BSE Scrip Code', 
@@ -138,265 +312,188 @@ class Command(BaseCommand):
             'Promoter/Non-promoter', 'Gender', 'Appointment Date'
         ]].drop_duplicates(subset=['DIN', 'BSE Scrip Code'])
         
-        directors_map = {}
-        director_count = 0
-        for _, row in directors_data.iterrows():
-            din = str(row['DIN']).strip()
-            if pd.isna(din) or din == 'nan' or len(din) < 8:
+        directors = {}
+        for (din_raw, dir_name, _company_name, bse_code, designation, category,
+             qualification, dob, promoter, gender, appointment) in directors_data.itertuples(index=False, name=None):
+            if din_raw is None:
                 continue
-            
-            company_id = str(row['BSE Scrip Code']).strip()
-            if company_id not in companies_map:
+            din = str(din_raw).strip()
+            if len(din) < 8:
                 continue
-            
-            company = companies_map[company_id]
-            name = row['Director Name'] or 'Unknown'
-            
-            try:
-                director, created = Director.objects.get_or_create(
-                    director_id=din,
-                    company=company,
-                    defaults={
-                        'name': name,
-                        'designation': row['Designation'] if not pd.isna(row['Designation']) else None,
-                        'category': row['Director Category'] if not pd.isna(row['Director Category']) else None,
-                        'qualification': row['Qualification'] if not pd.isna(row['Qualification']) else None,
-                        'dob': parse_date(row['DOB']),
-                        'promoter_status': row['Promoter/Non-promoter'] if not pd.isna(row['Promoter/Non-promoter']) else None,
-                        'gender': row['Gender'] if not pd.isna(row['Gender']) else None,
-                        'appointment_date': parse_date(row['Appointment Date']),
-                    }
-                )
-                
-                if created:
-                    self.stdout.write(f"✓ Created director: {name} (DIN: {din})")
-                    director_count += 1
-                else:
-                    self.stdout.write(f"→ Already exists: {name} (DIN: {din})")
-                    
-                directors_map[(din, company_id)] = director
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"✗ Error creating director {name}: {e}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"\nTotal directors: {len(directors_map)}"))
-        
-        # Create remuneration records
-        self.stdout.write(self.style.SUCCESS("\n" + "="*60))
-        self.stdout.write(self.style.SUCCESS("Step 3: Creating Director Remuneration Records..."))
-        self.stdout.write(self.style.SUCCESS("="*60))
-        
-        remuneration_count = 0
-        
-        # Process each year (Year 1 through Year 5)
-        for year_num in range(1, 6):
-            year_label_col = f'Year {year_num}'
-            if year_label_col not in df.columns:
+
+            company_id = str(bse_code).strip()
+            if company_id not in companies_map or (din, company_id) in directors:
                 continue
-            
-            self.stdout.write(f"\nProcessing {year_label_col}...")
-            
-            for _, row in df.iterrows():
-                din = str(row['DIN']).strip()
-                company_id = str(row['BSE Scrip Code']).strip()
-                
-                if (din, company_id) not in directors_map:
-                    continue
-                
-                # Check if year data exists
-                year_end_date_val = row.get(year_label_col)
-                if pd.isna(year_end_date_val):
-                    continue
-                
-                director = directors_map[(din, company_id)]
-                company = companies_map[company_id]
-                
-                fy_end_date = parse_date(year_end_date_val)
-                if not fy_end_date:
-                    continue
-                
-                fy_label = get_fiscal_year_label(fy_end_date)
-                
-                # Extract remuneration columns for this year
-                basic_salary = row.get(f'Year {year_num} Basic Salary')
-                pf = row.get(f'Year {year_num} PF/Retirement')
-                perqs = row.get(f'Year {year_num} Perquisites/Allowances')
-                bonus = row.get(f'Year {year_num} Bonus / Commission')
-                pay_excl_esops = row.get(f'Year {year_num} Pay (Excl ESOPS)')
-                esops = row.get(f'Year {year_num} ESOPS')
-                total_remuneration = row.get(f'Year {year_num} Total Remuneration')
-                options_granted = row.get(f'Year {year_num} Options Granted')
-                discount = row.get(f'Year {year_num} Discount')
-                fair_value = row.get(f'Year {year_num} Fair Value')
-                aggregate_value = row.get(f'Year {year_num} Aggregate Value')
-                remuneration_status = row.get(f'Year {year_num} Remuneration Status')
-                comments = row.get(f'Year {year_num} Comments')
-                
-                # Convert NaN to None for float fields using safe conversion
-                basic_salary = safe_float(basic_salary)
-                pf = safe_float(pf)
-                perqs = safe_float(perqs)
-                bonus = safe_float(bonus)
-                pay_excl_esops = safe_float(pay_excl_esops)
-                esops = safe_float(esops)
-                total_remuneration = safe_float(total_remuneration)
-                options_granted = safe_float(options_granted)
-                discount = safe_float(discount)
-                fair_value = safe_float(fair_value)
-                aggregate_value = safe_float(aggregate_value)
-                remuneration_status = None if pd.isna(remuneration_status) else str(remuneration_status)
-                comments = None if pd.isna(comments) else str(comments)
-                
-                try:
-                    remun, created = DirectorRemuneration.objects.get_or_create(
-                        company=company,
-                        director=director,
-                        fy_end_date=fy_end_date,
-                        defaults={
-                            'fy_label': fy_label,
-                            'basic_salary': basic_salary,
-                            'pf': pf,
-                            'perqs': perqs,
-                            'bonus': bonus,
-                            'pay_excl_esops': pay_excl_esops,
-                            'esops': esops,
-                            'total_remuneration': total_remuneration,
-                            'options_granted': options_granted,
-                            'discount': discount,
-                            'fair_value': fair_value,
-                            'aggregate_value': aggregate_value,
-                            'remuneration_status': remuneration_status,
-                            'comments': comments,
-                        }
-                    )
-                    if created:
-                        remuneration_count += 1
-                        if remuneration_count % 100 == 0:
-                            self.stdout.write(f"  ✓ Created {remuneration_count} remuneration records...")
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"✗ Error creating remuneration for {director} ({fy_label}): {e}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"\nTotal remuneration records created: {remuneration_count}"))
-        
-        # Create financial records
-        self.stdout.write(self.style.SUCCESS("\n" + "="*60))
-        self.stdout.write(self.style.SUCCESS("Step 4: Creating Company Financial Records..."))
-        self.stdout.write(self.style.SUCCESS("="*60))
+
+            directors[(din, company_id)] = Director(
+                director_id=din,
+                company=companies_map[company_id],
+                name=dir_name or 'Unknown',
+                designation=designation,
+                category=category,
+                qualification=qualification,
+                dob=parse_date(dob),
+                promoter_status=promoter,
+                gender=gender,
+                appointment_date=parse_date(appointment),
+            )
+
+        # Same pattern as companies, keyed on (din, company_id) since
+        # director_id alone is not unique across companies
+        din_set = {din for din, _ in directors}
+        existing_directors = {
+            (d.director_id, d.company_id): d
+            for d in Director.objects.filter(director_id__in=din_set)
+        }
+        missing_directors = [obj for key, obj in directors.items() if key not in existing_directors]
+        Director.objects.bulk_create(missing_directors, batch_size=10000, ignore_conflicts=True)
+
+        # Re-select so the map holds instances with PKs for FK assignment
+        # below. Two-level company_id -> din -> Director, so the row loop
+        # resolves directors with plain string keys instead of hashing a
+        # freshly allocated (din, company_id) tuple per lookup.
+        directors_by_company = {}
+        for d in Director.objects.filter(director_id__in=din_set):
+            directors_by_company.setdefault(d.company_id, {})[d.director_id] = d
+
+        director_count = sum(len(dins) for dins in directors_by_company.values())
+        progress(self.style.SUCCESS(f"\nTotal directors: {director_count}"))
         
+        # Create remuneration, financial and peer records in one pass
+        progress(self.style.SUCCESS("\n" + "="*60))
+        progress(self.style.SUCCESS("Step 3: Creating Remuneration, Financial and Peer Records..."))
+        progress(self.style.SUCCESS("="*60))
+
+        remun_update_fields = [
+            'fy_label', 'basic_salary', 'pf', 'perqs', 'bonus', 'pay_excl_esops',
+            'esops', 'total_remuneration', 'options_granted', 'discount',
+            'fair_value', 'aggregate_value', 'remuneration_status', 'comments',
+        ]
+        fin_update_fields = ['fy_label', 'total_income', 'pat', 'roa', 'employee_cost', 'mcap']
+
+        # Per-slot date/peer column handles (None when the column is absent)
+        remun_builders = [make_remun_builder(r) for r in remun_idx]
+        fin_builders = [make_fin_builder(f) for f in fin_idx]
+        remun_date_is = [col_idx.get(f'Year {n}') for n in range(1, 6)]
+        fin_date_is = [col_idx.get(f'Year {n}.1') for n in range(1, 6)]
+        peer_is = [col_idx.get(f'Peer {n} Comp') for n in range(1, 6)]
+        salary_i = col_idx.get('Salary to med emp pay')
+
+        remuneration_count = 0
         financial_count = 0
-        
-        for year_num in range(1, 6):
-            year_date_col = f'Year {year_num}.1'
-            if year_date_col not in df.columns:
-                continue
-            
-            self.stdout.write(f"\nProcessing financial data for Year {year_num}...")
-            
-            for _, row in df.iterrows():
-                company_id = str(row['BSE Scrip Code']).strip()
-                if company_id not in companies_map:
-                    continue
-                
-                company = companies_map[company_id]
-                
-                # Check if financial data exists for this year
-                fy_end_date_val = row.get(year_date_col)
-                if pd.isna(fy_end_date_val):
-                    continue
-                
-                fy_end_date = parse_date(fy_end_date_val)
-                if not fy_end_date:
-                    continue
-                
-                fy_label = get_fiscal_year_label(fy_end_date)
-                
-                # Extract financial columns for this year
-                total_income = row.get(f'Year {year_num} Total Income')
-                pat = row.get(f'Year {year_num} PAT')
-                roa = row.get(f'Year {year_num} ROA')
-                employee_cost = row.get(f'Year {year_num} Employee Cost')
-                mcap = row.get(f'Year {year_num} MCAP')
-                
-                # Convert NaN to None using safe conversion
-                total_income = safe_float(total_income)
-                pat = safe_float(pat)
-                roa = safe_float(roa)
-                employee_cost = safe_float(employee_cost)
-                mcap = safe_float(mcap)
-                
-                try:
-                    fin, created = CompanyFinancialTimeSeries.objects.get_or_create(
-                        company=company,
-                        fy_end_date=fy_end_date,
-                        defaults={
-                            'fy_label': fy_label,
-                            'total_income': total_income,
-                            'pat': pat,
-                            'roa': roa,
-                            'employee_cost': employee_cost,
-                            'mcap': mcap,
-                        }
-                    )
-                    if created:
-                        financial_count += 1
-                        if financial_count % 100 == 0:
-                            self.stdout.write(f"  ✓ Created {financial_count} financial records...")
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"✗ Error creating financial record for {company} ({fy_label}): {e}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"\nTotal financial records created: {financial_count}"))
-        
-        # Create peer comparisons
-        self.stdout.write(self.style.SUCCESS("\n" + "="*60))
-        self.stdout.write(self.style.SUCCESS("Step 5: Creating Peer Comparisons..."))
-        self.stdout.write(self.style.SUCCESS("="*60))
-        
         peer_count = 0
-        
-        for peer_num in range(1, 6):
-            peer_company_col = f'Peer {peer_num} Comp'
-            if peer_company_col not in df.columns:
+        remun_buf = {}  # (din, company_id, fy_end_date) -> DirectorRemuneration
+        fin_buf = {}    # (company_id, fy_end_date) -> CompanyFinancialTimeSeries
+        peer_buf = {}   # (company_id, peer_company_id) -> PeerComparison
+
+        def flush_remun():
+            nonlocal remuneration_count
+            try:
+                DirectorRemuneration.objects.bulk_create(
+                    remun_buf.values(),
+                    batch_size=5000,
+                    update_conflicts=True,
+                    unique_fields=['company', 'director', 'fy_end_date'],
+                    update_fields=remun_update_fields,
+                )
+                remuneration_count += len(remun_buf)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"✗ Error bulk-creating remuneration records: {e}"))
+            remun_buf.clear()
+
+        def flush_fin():
+            nonlocal financial_count
+            try:
+                CompanyFinancialTimeSeries.objects.bulk_create(
+                    fin_buf.values(),
+                    batch_size=5000,
+                    update_conflicts=True,
+                    unique_fields=['company', 'fy_end_date'],
+                    update_fields=fin_update_fields,
+                )
+                financial_count += len(fin_buf)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"✗ Error bulk-creating financial records: {e}"))
+            fin_buf.clear()
+
+        def flush_peer():
+            nonlocal peer_count
+            try:
+                # Upsert like the other record types, so a re-ingest refreshes
+                # the ratio on existing peer rows instead of skipping them
+                PeerComparison.objects.bulk_create(
+                    peer_buf.values(),
+                    batch_size=5000,
+                    update_conflicts=True,
+                    unique_fields=['company', 'peer_company', 'peer_position'],
+                    update_fields=['salary_to_median_emp_pay'],
+                )
+                peer_count += len(peer_buf)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"✗ Error bulk-creating peer comparisons: {e}"))
+            peer_buf.clear()
+
+        # One scan of the frame emits all three record types for all five year
+        # slots, instead of 15 full scans (5 slots x 3 record types). Buffers
+        # are flushed at 10k so peak memory stays at O(batch) instead of
+        # O(rows); duplicates of a key simply overwrite within the buffer.
+        for row in df.itertuples(index=False, name=None):
+            company_id = str(row[bse_i]).strip()
+            company = companies_map.get(company_id)
+            if company is None:
                 continue
-            
-            self.stdout.write(f"\nProcessing {peer_company_col}...")
-            
-            for _, row in df.iterrows():
-                company_id = str(row['BSE Scrip Code']).strip()
-                if company_id not in companies_map:
-                    continue
-                
-                company = companies_map[company_id]
-                
-                peer_company_id = str(row[peer_company_col]).strip()
-                if pd.isna(peer_company_id) or peer_company_id == 'nan' or peer_company_id not in companies_map:
-                    continue
-                
-                peer_company = companies_map[peer_company_id]
-                if peer_company_id == company_id:  # Skip self-comparisons
-                    continue
-                
-                salary_to_median = row.get('Salary to med emp pay')
-                salary_to_median = safe_float(salary_to_median)
-                
-                try:
-                    peer, created = PeerComparison.objects.get_or_create(
-                        company=company,
-                        peer_company=peer_company,
-                        peer_position=peer_num,
-                        defaults={
-                            'salary_to_median_emp_pay': salary_to_median,
-                        }
-                    )
-                    if created:
-                        peer_count += 1
-                        self.stdout.write(f"  ✓ Created peer comparison: {company} - Peer {peer_num}: {peer_company}")
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"✗ Error creating peer comparison: {e}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"\nTotal peer comparisons created: {peer_count}"))
+            din = str(row[din_i]).strip()
+            company_dirs = directors_by_company.get(company_id)
+            director = company_dirs.get(din) if company_dirs else None
+
+            for slot in range(5):
+                # Remuneration (needs a known director and a year-end date)
+                date_i = remun_date_is[slot]
+                if director is not None and date_i is not None:
+                    fy_end_date = parse_date(row[date_i])
+                    if fy_end_date:
+                        remun_buf[(din, company_id, fy_end_date)] = \
+                            remun_builders[slot](row, company, director, fy_end_date)
+
+                # Financials (company-level; year-end date is in 'Year {n}.1')
+                date_i = fin_date_is[slot]
+                if date_i is not None:
+                    fy_end_date = parse_date(row[date_i])
+                    if fy_end_date:
+                        fin_buf[(company_id, fy_end_date)] = \
+                            fin_builders[slot](row, company, fy_end_date)
+
+                # Peer comparisons
+                peer_i = peer_is[slot]
+                if peer_i is not None:
+                    peer_company_id = str(row[peer_i]).strip()
+                    peer_company = companies_map.get(peer_company_id)
+                    if peer_company is not None and peer_company_id != company_id:
+                        peer_buf[(company_id, peer_company_id)] = PeerComparison(
+                            company=company,
+                            peer_company=peer_company,
+                            peer_position=slot + 1,
+                            salary_to_median_emp_pay=cell(row, salary_i),
+                        )
+
+            if len(remun_buf) >= 10000:
+                flush_remun()
+            if len(fin_buf) >= 10000:
+                flush_fin()
+            if len(peer_buf) >= 10000:
+                flush_peer()
+
+        flush_remun()
+        flush_fin()
+        flush_peer()
+
+        progress(self.style.SUCCESS(f"\nTotal remuneration records created: {remuneration_count}"))
+        progress(self.style.SUCCESS(f"Total financial records created: {financial_count}"))
+        progress(self.style.SUCCESS(f"Total peer comparisons created: {peer_count}"))
         
-        self.stdout.write(self.style.SUCCESS("\n" + "="*60))
-        self.stdout.write(self.style.SUCCESS("✓ Data ingestion completed successfully!"))
-        self.stdout.write(self.style.SUCCESS("="*60))
+        progress(self.style.SUCCESS("\n" + "="*60))
+        progress(self.style.SUCCESS("✓ Data ingestion completed successfully!"))
+        progress(self.style.SUCCESS("="*60))
 
     def handle(self, *args, **options):
         excel_file = options.get('file')
@@ -410,5 +507,11 @@ class Command(BaseCommand):
         if not excel_path.exists():
             self.stdout.write(self.style.ERROR(f"Error: Excel file not found at {excel_path}"))
             return
-        
-        self.ingest_data(str(excel_path))
+
+        if connection.vendor == 'sqlite':
+            # Skip per-statement fsyncs for the duration of the ingest
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA synchronous = OFF')
+                cursor.execute('PRAGMA journal_mode = MEMORY')
+
+        self.ingest_data(str(excel_path), verbosity=options['verbosity'])
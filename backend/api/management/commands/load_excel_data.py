@@ -12,11 +12,14 @@ Usage:
     python manage.py load_excel_data path/to/file.xlsx --verbosity 2
 """
 
+import csv
+import functools
+import io
 import os
 import sys
 from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
 import pandas as pd
 from datetime import datetime
 import re
@@ -27,22 +30,119 @@ from api.models import (
 )
 
 
+# Columns streamed per table on the COPY insert path; names double as the
+# instance attribute names (FKs via their *_id attribute).
+COMPANY_COPY_COLS = ['company_id', 'name', 'sector', 'industry', 'index', 'employees']
+DIRECTOR_COPY_COLS = [
+    'director_id', 'name', 'company_id', 'appointment_date', 'designation',
+    'category', 'qualification', 'dob', 'promoter_status', 'gender',
+]
+REMUN_COPY_COLS = [
+    'company_id', 'director_id', 'fy_end_date', 'fy_label', 'basic_salary',
+    'pf', 'perqs', 'bonus', 'pay_excl_esops', 'esops', 'total_remuneration',
+    'options_granted', 'discount', 'fair_value', 'aggregate_value',
+    'remuneration_status', 'comments',
+]
+FINANCIAL_COPY_COLS = [
+    'company_id', 'fy_end_date', 'fy_label', 'total_income', 'pat', 'roa',
+    'employee_cost', 'mcap', 'employees',
+]
+PEER_COPY_COLS = ['company_id', 'peer_company_id', 'peer_position', 'salary_to_median_emp_pay']
+
+# One flush plan per model: the COPY column list and a batch size tuned to
+# the row width (narrow company/peer rows batch larger than the wide
+# remuneration rows).
+FLUSH_PLANS = {
+    Company: (COMPANY_COPY_COLS, 5000),
+    Director: (DIRECTOR_COPY_COLS, 5000),
+    DirectorRemuneration: (REMUN_COPY_COLS, 1000),
+    CompanyFinancialTimeSeries: (FINANCIAL_COPY_COLS, 2000),
+    PeerComparison: (PEER_COPY_COLS, 5000),
+}
+
+
+def copy_insert_ignore(model, objs, columns, batch_size=1000):
+    """
+    Insert instances, leaving conflicting rows untouched. On PostgreSQL the
+    rows are streamed with COPY into a temp table and moved across with
+    INSERT ... ON CONFLICT DO NOTHING, skipping per-row SQL entirely; other
+    backends fall back to bulk_create(ignore_conflicts=True). created_at and
+    updated_at are stamped by the INSERT since COPY bypasses auto_now.
+    """
+    objs = list(objs)
+    if not objs:
+        return
+    if connection.vendor != 'postgresql':
+        model.objects.bulk_create(objs, batch_size=batch_size, ignore_conflicts=True)
+        return
+    table = model._meta.db_table
+    col_sql = ', '.join(f'"{c}"' for c in columns)
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for obj in objs:
+        writer.writerow([getattr(obj, c) for c in columns])
+    buf.seek(0)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TEMP TABLE "tmp_{table}" AS SELECT {col_sql} FROM "{table}" WITH NO DATA'
+        )
+        # psycopg3 COPY API (the pinned driver); psycopg2's copy_expert
+        # does not exist on Django's psycopg3 cursor.
+        with cursor.copy(
+            f'COPY "tmp_{table}" ({col_sql}) FROM STDIN WITH (FORMAT csv, NULL \'\')'
+        ) as copy:
+            copy.write(buf.getvalue())
+        cursor.execute(
+            f'INSERT INTO "{table}" ({col_sql}, "created_at", "updated_at") '
+            f'SELECT {col_sql}, now(), now() FROM "tmp_{table}" ON CONFLICT DO NOTHING'
+        )
+        cursor.execute(f'DROP TABLE "tmp_{table}"')
+
+
 class ExcelDataLoader:
     """Handles loading data from Excel with flexible column mapping."""
     
     def __init__(self, filepath, verbosity=1):
         self.filepath = filepath
         self.verbosity = verbosity
+        # Hot row loops test this bool before building their log f-strings,
+        # so the formatting cost is only paid when it will be printed.
+        self._log2 = verbosity >= 2
+        # Per-model batch sizes come from FLUSH_PLANS; the env var, when
+        # set, overrides them all for tuning runs.
+        override = os.environ.get('COMPAYRE_BULK_CREATE_BATCH_SIZE')
+        self.bulk_batch_size = int(override) if override else None
+        # Sheet-name dispatch: first matching pattern wins, compiled once.
+        # Order matters (Dir Consol before the generic company/director hits).
+        self._dispatch = [
+            (re.compile(r'dir[ _]consol'), self.load_dir_consol_sheet),
+            (re.compile(r'^(?=.*company)(?!.*director)'), self.load_companies),
+            (re.compile(r'^(?=.*director)(?!.*remuneration)'), self.load_directors),
+            (re.compile(r'remuneration|compensation'), self.load_director_remuneration),
+            (re.compile(r'financ'), self.load_financial_data),
+            (re.compile(r'peer'), self.load_peer_comparisons),
+        ]
         self.stats = {}
+        # Normalized-header cache for find_column, keyed by the DataFrame's
+        # column Index identity (one entry at a time; sheets are loaded serially).
+        self._norm_cols = {}
+        self._norm_cols_for = None
         
     def log(self, level, message):
         """Print log messages based on verbosity level."""
-        verbosity_levels = {0: [0], 1: [0, 1], 2: [0, 1, 2], 3: [0, 1, 2]}
-        if level in verbosity_levels.get(self.verbosity, []):
+        if level <= self.verbosity:
             print(f"{'  ' * level}→ {message}")
+
+    def flush_pending(self, model, objs):
+        """Flush unsaved instances through the conflict-ignoring bulk path,
+        using the model's flush plan (COPY column list and batch size)."""
+        columns, batch_size = FLUSH_PLANS[model]
+        copy_insert_ignore(model, objs, columns, batch_size=self.bulk_batch_size or batch_size)
     
+    @functools.lru_cache(maxsize=None)
     def normalize_column_name(self, col_name):
-        """Normalize column names for matching."""
+        """Normalize column names for matching (memoized; the same handful of
+        names is normalized over and over while resolving columns)."""
         if not isinstance(col_name, str):
             return str(col_name).lower().strip()
         return col_name.lower().strip().replace(' ', '_').replace('-', '_').replace('/', '_')
@@ -52,18 +152,46 @@ class ExcelDataLoader:
         if isinstance(patterns, str):
             patterns = [patterns]
         
-        normalized_columns = {self.normalize_column_name(col): col for col in df.columns}
+        # Normalize the header once per sheet and reuse the map across calls;
+        # previously every lookup re-normalized every column name.
+        if self._norm_cols_for is not df.columns:
+            self._norm_cols_for = df.columns
+            self._norm_cols = {self.normalize_column_name(col): col for col in df.columns}
         
         for pattern in patterns:
             normalized_pattern = self.normalize_column_name(pattern)
-            if normalized_pattern in normalized_columns:
-                return normalized_columns[normalized_pattern]
+            if normalized_pattern in self._norm_cols:
+                return self._norm_cols[normalized_pattern]
         
         return None
     
+    def convert_columns(self, df, float_cols=(), date_cols=(), string_cols=()):
+        """
+        Convert whole columns up front so the row loops read plain
+        float/Timestamp/str/None values instead of calling safe_convert per
+        cell. Missing values are substituted with None (astype(object) keeps
+        datetime columns from coercing it back to NaT).
+        """
+        for col in float_cols:
+            if col:
+                s = pd.to_numeric(df[col], errors='coerce')
+                df[col] = s.astype(object).where(s.notna(), None)
+        for col in date_cols:
+            if col:
+                s = pd.to_datetime(df[col], errors='coerce')
+                df[col] = s.astype(object).where(s.notna(), None)
+        for col in string_cols:
+            if col:
+                s = df[col].astype('string').str.strip()
+                s = s.mask(s == '')
+                df[col] = s.astype(object).where(s.notna(), None)
+        return df
+
     def safe_convert(self, value, target_type):
         """Safely convert value to target type."""
-        if pd.isna(value) or value == '' or value is None:
+        # Cheap scalar checks instead of pd.isna, which dispatches through
+        # pandas for every cell; a float NaN is the only value != itself.
+        if value is None or value == '' or (isinstance(value, float) and value != value):
             return None
         
         try:
@@ -106,191 +234,263 @@ class ExcelDataLoader:
         # Verify required columns
         if not all([company_name_col, bse_code_col, director_name_col, din_col]):
             raise CommandError("Dir Consol sheet missing required columns: Company Name, BSE Scrip Code, Director Name, DIN")
-        
-        companies_created = 0
-        directors_created = 0
-        remuneration_created = 0
-        financial_created = 0
-        peer_created = 0
+
+        # Vectorized conversions: one pandas pass per column instead of a
+        # safe_convert call per cell; the row loop then reads values directly.
+        year_float_fields = [
+            'Basic Salary', 'PF/Retirement', 'Perquisites/Allowances',
+            'Bonus / Commission', 'Pay (Excl ESOPS)', 'ESOPS',
+            'Total Remuneration', 'Options Granted', 'Discount', 'Fair Value',
+            'Aggregate Value', 'Total Income', 'PAT', 'ROA', 'Employee Cost', 'MCAP',
+        ]
+        # Resolve every per-year/per-peer column in a single pass over the
+        # header: one compiled regex classifies each normalized name into
+        # (year, field), year-date or peer slots, instead of probing ~75
+        # "Year {y} {field}" permutations individually. The conversion pass
+        # and the row loop below then do plain dict lookups.
+        year_field_names = year_float_fields + ['Remuneration Status', 'Comments']
+        norm_fields = {self.normalize_column_name(f): f for f in year_field_names}
+        year_col_re = re.compile(
+            r'year_([1-5])(?:_(' + '|'.join(map(re.escape, norm_fields)) + r'))?$'
+        )
+        peer_col_re = re.compile(r'peer_([1-5])_comp$')
+        year_cols = {y: dict.fromkeys(year_field_names) for y in range(1, 6)}
+        year_date_cols = dict.fromkeys(range(1, 6))
+        peer_cols = dict.fromkeys(range(1, 6))
+        for col in df.columns:
+            norm = self.normalize_column_name(col)
+            m = year_col_re.match(norm)
+            if m:
+                year = int(m.group(1))
+                if m.group(2):
+                    year_cols[year][norm_fields[m.group(2)]] = col
+                else:
+                    year_date_cols[year] = col
+                continue
+            m = peer_col_re.match(norm)
+            if m:
+                peer_cols[int(m.group(1))] = col
+        salary_ratio_col = self.find_column(df, ['Salary to med emp pay'])
+
+        float_cols = [
+            year_cols[y][field] for y in range(1, 6) for field in year_float_fields
+        ]
+        float_cols.append(salary_ratio_col)
+        date_cols = [dob_col, appointment_col] + list(year_date_cols.values())
+        string_cols = [
+            company_name_col, director_name_col, designation_col, category_col,
+            qualification_col, promoter_col, gender_col, sector_col,
+            industry_col, index_col,
+        ]
+        string_cols += [year_cols[y]['Remuneration Status'] for y in range(1, 6)]
+        string_cols += [year_cols[y]['Comments'] for y in range(1, 6)]
+        df = self.convert_columns(df, float_cols=float_cols, date_cols=date_cols, string_cols=string_cols)
+
         skipped = 0
-        
-        for idx, row in df.iterrows():
+
+        # Pass 1: collect everything into dicts keyed by natural key, with no
+        # ORM calls in the row loop. Company's PK is the company_id string, so
+        # dependent rows can carry the FK value directly instead of holding a
+        # fetched Company instance.
+        companies = {}      # company_id -> Company
+        directors = {}      # (din, company_id) -> Director
+        remunerations = {}  # (din, company_id, fy_date) -> field dict
+        financials = {}     # (company_id, fy_date) -> CompanyFinancialTimeSeries
+        peers = {}          # (company_id, peer_company_id, peer_num) -> salary ratio
+
+        # Positional handles for itertuples (index occupies slot 0); avoids
+        # the per-row Series construction that iterrows() pays for.
+        col_pos = {col: i + 1 for i, col in enumerate(df.columns)}
+
+        def cval(row, col):
+            return row[col_pos[col]] if col else None
+
+        # Row validity decided columnwise up front: one C-level bool load per
+        # row replaces the per-row list build + truthiness test over the four
+        # required fields.
+        valid_mask = (
+            df[company_name_col].notna()
+            & df[bse_code_col].notna()
+            & df[director_name_col].notna()
+            & df[din_col].notna()
+        ).to_numpy()
+
+        def id_str_array(col):
+            """Canonical string form of an id column, computed in one
+            vectorized pass: numeric ids lose their float artefacts
+            ('532480.0' -> '532480'), textual ids such as 'DIN10120' keep
+            their raw form, empty cells become None."""
+            raw = df[col]
+            nums = pd.to_numeric(raw, errors='coerce')
+            out = nums.astype('Int64').astype(str).astype(object)
+            out = out.where(nums.notna(), raw.astype(str).str.strip())
+            return out.where(raw.notna(), None).to_numpy()
+
+        bse_arr = id_str_array(bse_code_col)
+        din_arr = id_str_array(din_col)
+        peer_id_arrs = {p: (id_str_array(c) if (c := peer_cols[p]) is not None else None)
+                        for p in range(1, 6)}
+
+        # Per-year column arrays (struct-of-arrays): each used column is
+        # pulled out of the frame once, so the year loop reads plain array
+        # slots instead of going through the positional row lookup per field.
+        # Missing columns share one all-None list.
+        none_col = [None] * len(df)
+
+        def col_array(col):
+            return df[col].to_numpy() if col else none_col
+
+        remun_field_cols = [
+            ('basic_salary', 'Basic Salary'), ('pf', 'PF/Retirement'),
+            ('perqs', 'Perquisites/Allowances'), ('bonus', 'Bonus / Commission'),
+            ('pay_excl_esops', 'Pay (Excl ESOPS)'), ('esops', 'ESOPS'),
+            ('total_remuneration', 'Total Remuneration'), ('options_granted', 'Options Granted'),
+            ('discount', 'Discount'), ('fair_value', 'Fair Value'),
+            ('aggregate_value', 'Aggregate Value'), ('remuneration_status', 'Remuneration Status'),
+            ('comments', 'Comments'),
+        ]
+        fin_field_cols = [
+            ('pat', 'PAT'), ('roa', 'ROA'),
+            ('employee_cost', 'Employee Cost'), ('mcap', 'MCAP'),
+        ]
+        remun_arrs = {y: [(f, col_array(year_cols[y][c])) for f, c in remun_field_cols] for y in range(1, 6)}
+        fin_arrs = {y: [(f, col_array(year_cols[y][c])) for f, c in fin_field_cols] for y in range(1, 6)}
+        year_date_arrs = {y: col_array(year_date_cols[y]) for y in range(1, 6)}
+        total_income_arrs = {y: col_array(year_cols[y]['Total Income']) for y in range(1, 6)}
+        salary_ratio_arr = col_array(salary_ratio_col)
+
+        for row in df.itertuples(index=True, name=None):
+            idx = row[0]
             try:
-                company_name = self.safe_convert(row.get(company_name_col), 'string')
-                bse_code = str(self.safe_convert(row.get(bse_code_col), 'int')) if bse_code_col else None
-                director_name = self.safe_convert(row.get(director_name_col), 'string')
-                din = str(self.safe_convert(row.get(din_col), 'int')) if din_col else None
-                
-                if not all([company_name, bse_code, director_name, din]):
-                    if idx < 3:  # Log first few rows
-                        self.log(2, f"Row {idx}: Missing fields - Name:{company_name}, Code:{bse_code}, Dir:{director_name}, DIN:{din}")
+                if not valid_mask[idx]:
+                    if idx < 3 and self._log2:  # Log first few rows
+                        self.log(2, f"Row {idx}: Missing fields - Name:{cval(row, company_name_col)}, "
+                                    f"Code:{cval(row, bse_code_col)}, Dir:{cval(row, director_name_col)}, "
+                                    f"DIN:{cval(row, din_col)}")
                     skipped += 1
                     continue
-                
-                # Create/get Company
-                try:
-                    company, company_created = Company.objects.get_or_create(
+
+                company_name = cval(row, company_name_col)
+                bse_code = bse_arr[idx]
+                director_name = cval(row, director_name_col)
+                din = din_arr[idx]
+
+                if bse_code not in companies:
+                    companies[bse_code] = Company(
                         company_id=bse_code,
-                        defaults={
-                            'name': company_name,
-                            'sector': self.safe_convert(row.get(sector_col), 'string'),
-                            'industry': self.safe_convert(row.get(industry_col), 'string'),
-                            'index': self.safe_convert(row.get(index_col), 'string'),
-                            'employees': self.safe_convert(row.get(employees_col), 'int'),
-                        }
+                        name=company_name,
+                        sector=cval(row, sector_col),
+                        industry=cval(row, industry_col),
+                        index=cval(row, index_col),
+                        employees=self.safe_convert(cval(row, employees_col), 'int'),
                     )
-                    if company_created:
-                        companies_created += 1
-                        if idx < 3:
-                            self.log(2, f"Row {idx}: Created company {bse_code}")
-                except Exception as e:
-                    if idx < 3:
-                        self.log(2, f"Row {idx}: Company error - {str(e)[:100]}")
-                    skipped += 1
-                    continue
-                
-                # Create/get Director
-                try:
-                    director, director_created = Director.objects.get_or_create(
+
+                if (din, bse_code) not in directors:
+                    directors[(din, bse_code)] = Director(
                         director_id=din,
-                        company=company,
-                        defaults={
-                            'name': director_name,
-                            'designation': self.safe_convert(row.get(designation_col), 'string'),
-                            'category': self.safe_convert(row.get(category_col), 'string'),
-                            'qualification': self.safe_convert(row.get(qualification_col), 'string'),
-                            'dob': self.safe_convert(row.get(dob_col), 'date'),
-                            'promoter_status': self.safe_convert(row.get(promoter_col), 'string'),
-                            'appointment_date': self.safe_convert(row.get(appointment_col), 'date'),
-                            'gender': self.safe_convert(row.get(gender_col), 'string'),
-                        }
+                        company_id=bse_code,
+                        name=director_name,
+                        designation=cval(row, designation_col),
+                        category=cval(row, category_col),
+                        qualification=cval(row, qualification_col),
+                        dob=cval(row, dob_col),
+                        promoter_status=cval(row, promoter_col),
+                        appointment_date=cval(row, appointment_col),
+                        gender=cval(row, gender_col),
                     )
-                    if director_created:
-                        directors_created += 1
-                        if idx < 3:
-                            self.log(2, f"Row {idx}: Created director {din}")
-                except Exception as e:
-                    if idx < 3:
-                        self.log(2, f"Row {idx}: Director error - {str(e)[:100]}")
-                    skipped += 1
-                    continue
-                
+
                 # Process multi-year data (Years 1-5)
                 for year_num in range(1, 6):
-                    year_label = f"Year {year_num}"
-                    
-                    # Find year date column
-                    year_col = self.find_column(df, [year_label])
-                    if not year_col or pd.isna(row.get(year_col)):
-                        continue
-                    
-                    fy_date = self.safe_convert(row.get(year_col), 'date')
-                    if not fy_date:
+                    fy_date = year_date_arrs[year_num][idx]
+                    if fy_date is None:
                         continue
-                    
+
                     fy_label = f"FY{fy_date.year}"
-                    
-                    # Director Remuneration
-                    remun_data = {
-                        'basic_salary': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Basic Salary'])), 'float'),
-                        'pf': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} PF/Retirement'])), 'float'),
-                        'perqs': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Perquisites/Allowances'])), 'float'),
-                        'bonus': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Bonus / Commission'])), 'float'),
-                        'pay_excl_esops': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Pay (Excl ESOPS)'])), 'float'),
-                        'esops': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} ESOPS'])), 'float'),
-                        'total_remuneration': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Total Remuneration'])), 'float'),
-                        'options_granted': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Options Granted'])), 'float'),
-                        'discount': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Discount'])), 'float'),
-                        'fair_value': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Fair Value'])), 'float'),
-                        'aggregate_value': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Aggregate Value'])), 'float'),
-                        'remuneration_status': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Remuneration Status'])), 'string'),
-                        'comments': self.safe_convert(
-                            row.get(self.find_column(df, [f'{year_label} Comments'])), 'string'),
-                    }
-                    
-                    remun, remun_created = DirectorRemuneration.objects.get_or_create(
-                        company=company,
-                        director=director,
-                        fy_end_date=fy_date,
-                        defaults={
-                            'fy_label': fy_label,
-                            **remun_data
-                        }
-                    )
-                    if remun_created:
-                        remuneration_created += 1
-                    
+
+                    # Director Remuneration (instances built in pass 2, once
+                    # the director PKs exist)
+                    fields = {f: arr[idx] for f, arr in remun_arrs[year_num]}
+                    fields['fy_label'] = fy_label
+                    remunerations[(din, bse_code, fy_date)] = fields
+
                     # Company Financial Data
-                    total_income_col = self.find_column(df, [f'{year_label} Total Income'])
-                    if total_income_col and not pd.isna(row.get(total_income_col)):
-                        financial_data = {
-                            'total_income': self.safe_convert(row.get(total_income_col), 'float'),
-                            'pat': self.safe_convert(
-                                row.get(self.find_column(df, [f'{year_label} PAT'])), 'float'),
-                            'roa': self.safe_convert(
-                                row.get(self.find_column(df, [f'{year_label} ROA'])), 'float'),
-                            'employee_cost': self.safe_convert(
-                                row.get(self.find_column(df, [f'{year_label} Employee Cost'])), 'float'),
-                            'mcap': self.safe_convert(
-                                row.get(self.find_column(df, [f'{year_label} MCAP'])), 'float'),
-                        }
-                        
-                        financial, fin_created = CompanyFinancialTimeSeries.objects.get_or_create(
-                            company=company,
+                    total_income = total_income_arrs[year_num][idx]
+                    if total_income is not None:
+                        financials[(bse_code, fy_date)] = CompanyFinancialTimeSeries(
+                            company_id=bse_code,
                             fy_end_date=fy_date,
-                            defaults={
-                                'fy_label': fy_label,
-                                **financial_data
-                            }
+                            fy_label=fy_label,
+                            total_income=total_income,
+                            **{f: arr[idx] for f, arr in fin_arrs[year_num]},
                         )
-                        if fin_created:
-                            financial_created += 1
-                
+
                 # Peer Comparisons
                 for peer_num in range(1, 6):
-                    peer_comp_col = self.find_column(df, [f'Peer {peer_num} Comp'])
-                    if not peer_comp_col or pd.isna(row.get(peer_comp_col)):
-                        continue
-                    
-                    peer_company_id = str(self.safe_convert(row.get(peer_comp_col), 'int')) if peer_comp_col else None
+                    arr = peer_id_arrs[peer_num]
+                    peer_company_id = arr[idx] if arr is not None else None
                     if not peer_company_id:
                         continue
-                    
-                    salary_ratio_col = self.find_column(df, ['Salary to med emp pay'])
-                    
-                    try:
-                        peer_company = Company.objects.get(company_id=peer_company_id)
-                        
-                        peer_comp, peer_created_flag = PeerComparison.objects.get_or_create(
-                            company=company,
-                            peer_company=peer_company,
-                            peer_position=peer_num,
-                            defaults={
-                                'salary_to_median_emp_pay': self.safe_convert(
-                                    row.get(salary_ratio_col), 'float') if salary_ratio_col else None
-                            }
-                        )
-                        if peer_created_flag:
-                            peer_created += 1
-                    except Company.DoesNotExist:
-                        pass
-                    except Exception:
-                        pass
-                
+
+                    peers[(bse_code, peer_company_id, peer_num)] = salary_ratio_arr[idx]
+
             except Exception as e:
                 skipped += 1
+
+        # Pass 2: flush with bulk_create instead of one get_or_create round-trip
+        # per row; ignore_conflicts preserves get_or_create's keep-existing
+        # semantics. Created counts come from count deltas per model.
+        counts_before = {
+            'companies': Company.objects.count(),
+            'directors': Director.objects.count(),
+            'remuneration': DirectorRemuneration.objects.count(),
+            'financial': CompanyFinancialTimeSeries.objects.count(),
+            'peers': PeerComparison.objects.count(),
+        }
+
+        self.flush_pending(Company, companies.values())
+        self.flush_pending(Director, directors.values())
+
+        # Re-select directors so remuneration rows can reference their PKs
+        director_pks = {
+            (d.director_id, d.company_id): d.pk
+            for d in Director.objects.filter(director_id__in={din for din, _ in directors})
+        }
+        remun_objs = [
+            DirectorRemuneration(
+                company_id=company_id,
+                director_id=director_pks[(din, company_id)],
+                fy_end_date=fy_date,
+                **fields,
+            )
+            for (din, company_id, fy_date), fields in remunerations.items()
+            if (din, company_id) in director_pks
+        ]
+        self.flush_pending(DirectorRemuneration, remun_objs)
+        self.flush_pending(CompanyFinancialTimeSeries, financials.values())
+
+        # Peers may reference companies outside this sheet; keep only the ones
+        # that exist (one query replaces the per-row Company.objects.get)
+        peer_ids = {peer_id for _, peer_id, _ in peers}
+        known_peer_ids = set(
+            Company.objects.filter(company_id__in=peer_ids).values_list('company_id', flat=True)
+        )
+        peer_objs = [
+            PeerComparison(
+                company_id=company_id,
+                peer_company_id=peer_company_id,
+                peer_position=peer_num,
+                salary_to_median_emp_pay=ratio,
+            )
+            for (company_id, peer_company_id, peer_num), ratio in peers.items()
+            if peer_company_id in known_peer_ids and peer_company_id != company_id
+        ]
+        self.flush_pending(PeerComparison, peer_objs)
+
+        companies_created = Company.objects.count() - counts_before['companies']
+        directors_created = Director.objects.count() - counts_before['directors']
+        remuneration_created = DirectorRemuneration.objects.count() - counts_before['remuneration']
+        financial_created = CompanyFinancialTimeSeries.objects.count() - counts_before['financial']
+        peer_created = PeerComparison.objects.count() - counts_before['peers']
         
         self.stats['dir_consol'] = {
             'companies': companies_created,
@@ -312,15 +512,10 @@ class ExcelDataLoader:
     def get_column_mapping(self, df, expected_fields):
         """Create a mapping between Excel columns and model fields."""
         column_mapping = {}
-        df_columns_normalized = {
-            self.normalize_column_name(col): col 
-            for col in df.columns
-        }
-        
         for field in expected_fields:
-            normalized_field = self.normalize_column_name(field)
-            if normalized_field in df_columns_normalized:
-                column_mapping[field] = df_columns_normalized[normalized_field]
+            col = self.find_column(df, [field])
+            if col is not None:
+                column_mapping[field] = col
             else:
                 self.log(2, f"⚠️  Column '{field}' not found (will use None)")
         
@@ -334,40 +529,56 @@ class ExcelDataLoader:
         
         if not mapping.get('company_id') or not mapping.get('name'):
             raise CommandError("Companies sheet must have 'company_id' and 'name' columns")
-        
+
+        # Unsaved instances collected per natural key and flushed in one bulk
+        # call: in-file duplicates are dropped on collection, rows already in
+        # the database are left untouched by the conflict handling.
+        pending = {}
         created_count = 0
         skipped_count = 0
         
-        for idx, row in df.iterrows():
+        # Positional handles for itertuples (index occupies slot 0); avoids
+        # the per-row Series construction that iterrows() pays for.
+        col_pos = {col: i + 1 for i, col in enumerate(df.columns)}
+
+        def cval(row, col):
+            return row[col_pos[col]] if col else None
+
+        for row in df.itertuples(index=True, name=None):
+            idx = row[0]
             try:
-                company_id = self.safe_convert(row.get(mapping['company_id']), 'string')
-                name = self.safe_convert(row.get(mapping['name']), 'string')
+                company_id = self.safe_convert(cval(row, mapping['company_id']), 'string')
+                name = self.safe_convert(cval(row, mapping['name']), 'string')
                 
                 if not company_id or not name:
-                    self.log(2, f"Row {idx}: Skipped (missing company_id or name)")
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Skipped (missing company_id or name)")
                     skipped_count += 1
                     continue
                 
-                company, created = Company.objects.get_or_create(
+                if company_id in pending:
+                    skipped_count += 1
+                    continue
+
+                pending[company_id] = Company(
                     company_id=company_id,
-                    defaults={
-                        'name': name,
-                        'sector': self.safe_convert(row.get(mapping.get('sector')), 'string'),
-                        'industry': self.safe_convert(row.get(mapping.get('industry')), 'string'),
-                        'index': self.safe_convert(row.get(mapping.get('index')), 'string'),
-                        'employees': self.safe_convert(row.get(mapping.get('employees')), 'int'),
-                    }
+                    name=name,
+                    sector=self.safe_convert(cval(row, mapping.get('sector')), 'string'),
+                    industry=self.safe_convert(cval(row, mapping.get('industry')), 'string'),
+                    index=self.safe_convert(cval(row, mapping.get('index')), 'string'),
+                    employees=self.safe_convert(cval(row, mapping.get('employees')), 'int'),
                 )
-                
-                if created:
-                    created_count += 1
-                else:
-                    skipped_count += 1
-                    
+
             except Exception as e:
-                self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
+                if self._log2:
+                    self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
                 skipped_count += 1
-        
+
+        before = Company.objects.count()
+        self.flush_pending(Company, pending.values())
+        created_count = Company.objects.count() - before
+        skipped_count += len(pending) - created_count
+
         self.stats['companies'] = {'created': created_count, 'skipped': skipped_count}
         self.log(1, f"Companies: {created_count} created, {skipped_count} skipped")
     
@@ -382,52 +593,76 @@ class ExcelDataLoader:
         
         if not mapping.get('director_id') or not mapping.get('name') or not mapping.get('company_id'):
             raise CommandError("Directors sheet must have 'director_id', 'name', and 'company_id' columns")
-        
+
+        # One bulk fetch replaces the per-row Company.objects.get round-trip.
+        company_ids = {self.safe_convert(v, 'string') for v in df[mapping['company_id']].dropna().unique()}
+        company_ids.discard(None)
+        companies = Company.objects.in_bulk(company_ids, field_name='company_id')
+
+        # Whole-column conversions replace the per-cell safe_convert calls
+        # for typed fields; the loop reads native values (or None) directly.
+        df = self.convert_columns(df, date_cols=[mapping.get('dob'), mapping.get('appointment_date')])
+
+        # Unsaved instances collected per natural key and flushed in one bulk
+        # call: in-file duplicates are dropped on collection, rows already in
+        # the database are left untouched by the conflict handling.
+        pending = {}
         created_count = 0
         skipped_count = 0
         
-        for idx, row in df.iterrows():
+        # Positional handles for itertuples (index occupies slot 0); avoids
+        # the per-row Series construction that iterrows() pays for.
+        col_pos = {col: i + 1 for i, col in enumerate(df.columns)}
+
+        def cval(row, col):
+            return row[col_pos[col]] if col else None
+
+        for row in df.itertuples(index=True, name=None):
+            idx = row[0]
             try:
-                director_id = self.safe_convert(row.get(mapping['director_id']), 'string')
-                name = self.safe_convert(row.get(mapping['name']), 'string')
-                company_id = self.safe_convert(row.get(mapping['company_id']), 'string')
+                director_id = self.safe_convert(cval(row, mapping['director_id']), 'string')
+                name = self.safe_convert(cval(row, mapping['name']), 'string')
+                company_id = self.safe_convert(cval(row, mapping['company_id']), 'string')
                 
                 if not director_id or not name or not company_id:
-                    self.log(2, f"Row {idx}: Skipped (missing required fields)")
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Skipped (missing required fields)")
                     skipped_count += 1
                     continue
                 
-                try:
-                    company = Company.objects.get(company_id=company_id)
-                except Company.DoesNotExist:
-                    self.log(2, f"Row {idx}: Company {company_id} not found, skipped")
+                if company_id not in companies:
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Company {company_id} not found, skipped")
                     skipped_count += 1
                     continue
                 
-                director, created = Director.objects.get_or_create(
+                if (director_id, company_id) in pending:
+                    skipped_count += 1
+                    continue
+
+                pending[(director_id, company_id)] = Director(
                     director_id=director_id,
-                    company=company,
-                    defaults={
-                        'name': name,
-                        'designation': self.safe_convert(row.get(mapping.get('designation')), 'string'),
-                        'category': self.safe_convert(row.get(mapping.get('category')), 'string'),
-                        'qualification': self.safe_convert(row.get(mapping.get('qualification')), 'string'),
-                        'dob': self.safe_convert(row.get(mapping.get('dob')), 'date'),
-                        'appointment_date': self.safe_convert(row.get(mapping.get('appointment_date')), 'date'),
-                        'promoter_status': self.safe_convert(row.get(mapping.get('promoter_status')), 'string'),
-                        'gender': self.safe_convert(row.get(mapping.get('gender')), 'string'),
-                    }
+                    company_id=company_id,
+                    name=name,
+                    designation=self.safe_convert(cval(row, mapping.get('designation')), 'string'),
+                    category=self.safe_convert(cval(row, mapping.get('category')), 'string'),
+                    qualification=self.safe_convert(cval(row, mapping.get('qualification')), 'string'),
+                    dob=cval(row, mapping.get('dob')),
+                    appointment_date=cval(row, mapping.get('appointment_date')),
+                    promoter_status=self.safe_convert(cval(row, mapping.get('promoter_status')), 'string'),
+                    gender=self.safe_convert(cval(row, mapping.get('gender')), 'string'),
                 )
-                
-                if created:
-                    created_count += 1
-                else:
-                    skipped_count += 1
-                    
+
             except Exception as e:
-                self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
+                if self._log2:
+                    self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
                 skipped_count += 1
-        
+
+        before = Director.objects.count()
+        self.flush_pending(Director, pending.values())
+        created_count = Director.objects.count() - before
+        skipped_count += len(pending) - created_count
+
         self.stats['directors'] = {'created': created_count, 'skipped': skipped_count}
         self.log(1, f"Directors: {created_count} created, {skipped_count} skipped")
     
@@ -445,61 +680,101 @@ class ExcelDataLoader:
         required = ['company_id', 'director_id', 'fy_end_date', 'fy_label']
         if not all(mapping.get(field) for field in required):
             raise CommandError(f"Director Remuneration sheet must have: {', '.join(required)}")
-        
+
+        # Bulk-fetch the companies and directors the sheet references so the
+        # row loop resolves both FKs from dicts instead of two queries per row.
+        company_ids = {self.safe_convert(v, 'string') for v in df[mapping['company_id']].dropna().unique()}
+        company_ids.discard(None)
+        companies = Company.objects.in_bulk(company_ids, field_name='company_id')
+        director_ids = {self.safe_convert(v, 'string') for v in df[mapping['director_id']].dropna().unique()}
+        director_ids.discard(None)
+        directors = {
+            (d.director_id, d.company_id): d
+            for d in Director.objects.filter(director_id__in=director_ids)
+        }
+
+        # Whole-column conversions replace the per-cell safe_convert calls
+        # for typed fields; the loop reads native values (or None) directly.
+        df = self.convert_columns(
+            df,
+            float_cols=[mapping.get(f) for f in (
+                'basic_salary', 'pf', 'perqs', 'bonus', 'pay_excl_esops', 'esops',
+                'total_remuneration', 'options_granted', 'discount', 'fair_value',
+                'aggregate_value',
+            )],
+            date_cols=[mapping.get('fy_end_date')],
+            string_cols=[mapping.get('fy_label'), mapping.get('remuneration_status'), mapping.get('comments')],
+        )
+
+        # Unsaved instances collected per natural key and flushed in one bulk
+        # call: in-file duplicates are dropped on collection, rows already in
+        # the database are left untouched by the conflict handling.
+        pending = {}
         created_count = 0
         skipped_count = 0
         
-        for idx, row in df.iterrows():
+        # Positional handles for itertuples (index occupies slot 0); avoids
+        # the per-row Series construction that iterrows() pays for.
+        col_pos = {col: i + 1 for i, col in enumerate(df.columns)}
+
+        def cval(row, col):
+            return row[col_pos[col]] if col else None
+
+        for row in df.itertuples(index=True, name=None):
+            idx = row[0]
             try:
-                company_id = self.safe_convert(row.get(mapping['company_id']), 'string')
-                director_id = self.safe_convert(row.get(mapping['director_id']), 'string')
-                fy_end_date = self.safe_convert(row.get(mapping['fy_end_date']), 'date')
-                fy_label = self.safe_convert(row.get(mapping['fy_label']), 'string')
+                company_id = self.safe_convert(cval(row, mapping['company_id']), 'string')
+                director_id = self.safe_convert(cval(row, mapping['director_id']), 'string')
+                fy_end_date = cval(row, mapping['fy_end_date'])
+                fy_label = cval(row, mapping['fy_label'])
                 
                 if not all([company_id, director_id, fy_end_date, fy_label]):
-                    self.log(2, f"Row {idx}: Skipped (missing required fields)")
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Skipped (missing required fields)")
                     skipped_count += 1
                     continue
                 
-                try:
-                    company = Company.objects.get(company_id=company_id)
-                    director = Director.objects.get(director_id=director_id, company=company)
-                except (Company.DoesNotExist, Director.DoesNotExist):
-                    self.log(2, f"Row {idx}: Company or Director not found, skipped")
+                director = directors.get((director_id, company_id))
+                if company_id not in companies or director is None:
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Company or Director not found, skipped")
                     skipped_count += 1
                     continue
                 
-                remuneration, created = DirectorRemuneration.objects.get_or_create(
-                    company=company,
-                    director=director,
+                if (company_id, director_id, fy_end_date) in pending:
+                    skipped_count += 1
+                    continue
+
+                pending[(company_id, director_id, fy_end_date)] = DirectorRemuneration(
+                    company_id=company_id,
+                    director_id=director.pk,
                     fy_end_date=fy_end_date,
-                    defaults={
-                        'fy_label': fy_label,
-                        'basic_salary': self.safe_convert(row.get(mapping.get('basic_salary')), 'float'),
-                        'pf': self.safe_convert(row.get(mapping.get('pf')), 'float'),
-                        'perqs': self.safe_convert(row.get(mapping.get('perqs')), 'float'),
-                        'bonus': self.safe_convert(row.get(mapping.get('bonus')), 'float'),
-                        'pay_excl_esops': self.safe_convert(row.get(mapping.get('pay_excl_esops')), 'float'),
-                        'esops': self.safe_convert(row.get(mapping.get('esops')), 'float'),
-                        'total_remuneration': self.safe_convert(row.get(mapping.get('total_remuneration')), 'float'),
-                        'options_granted': self.safe_convert(row.get(mapping.get('options_granted')), 'float'),
-                        'discount': self.safe_convert(row.get(mapping.get('discount')), 'float'),
-                        'fair_value': self.safe_convert(row.get(mapping.get('fair_value')), 'float'),
-                        'aggregate_value': self.safe_convert(row.get(mapping.get('aggregate_value')), 'float'),
-                        'remuneration_status': self.safe_convert(row.get(mapping.get('remuneration_status')), 'string'),
-                        'comments': self.safe_convert(row.get(mapping.get('comments')), 'string'),
-                    }
+                    fy_label=fy_label,
+                    basic_salary=cval(row, mapping.get('basic_salary')),
+                    pf=cval(row, mapping.get('pf')),
+                    perqs=cval(row, mapping.get('perqs')),
+                    bonus=cval(row, mapping.get('bonus')),
+                    pay_excl_esops=cval(row, mapping.get('pay_excl_esops')),
+                    esops=cval(row, mapping.get('esops')),
+                    total_remuneration=cval(row, mapping.get('total_remuneration')),
+                    options_granted=cval(row, mapping.get('options_granted')),
+                    discount=cval(row, mapping.get('discount')),
+                    fair_value=cval(row, mapping.get('fair_value')),
+                    aggregate_value=cval(row, mapping.get('aggregate_value')),
+                    remuneration_status=cval(row, mapping.get('remuneration_status')),
+                    comments=cval(row, mapping.get('comments')),
                 )
-                
-                if created:
-                    created_count += 1
-                else:
-                    skipped_count += 1
-                    
+
             except Exception as e:
-                self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
+                if self._log2:
+                    self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
                 skipped_count += 1
-        
+
+        before = DirectorRemuneration.objects.count()
+        self.flush_pending(DirectorRemuneration, pending.values())
+        created_count = DirectorRemuneration.objects.count() - before
+        skipped_count += len(pending) - created_count
+
         self.stats['director_remuneration'] = {'created': created_count, 'skipped': skipped_count}
         self.log(1, f"Director Remuneration: {created_count} created, {skipped_count} skipped")
     
@@ -515,51 +790,80 @@ class ExcelDataLoader:
         required = ['company_id', 'fy_end_date', 'fy_label']
         if not all(mapping.get(field) for field in required):
             raise CommandError(f"Financial sheet must have: {', '.join(required)}")
-        
+
+        # One bulk fetch replaces the per-row Company.objects.get round-trip.
+        company_ids = {self.safe_convert(v, 'string') for v in df[mapping['company_id']].dropna().unique()}
+        company_ids.discard(None)
+        companies = Company.objects.in_bulk(company_ids, field_name='company_id')
+
+        # Whole-column conversions replace the per-cell safe_convert calls
+        # for typed fields; the loop reads native values (or None) directly.
+        df = self.convert_columns(
+            df,
+            float_cols=[mapping.get(f) for f in ('total_income', 'pat', 'roa', 'employee_cost', 'mcap')],
+            date_cols=[mapping.get('fy_end_date')],
+            string_cols=[mapping.get('fy_label')],
+        )
+
+        # Unsaved instances collected per natural key and flushed in one bulk
+        # call: in-file duplicates are dropped on collection, rows already in
+        # the database are left untouched by the conflict handling.
+        pending = {}
         created_count = 0
         skipped_count = 0
         
-        for idx, row in df.iterrows():
+        # Positional handles for itertuples (index occupies slot 0); avoids
+        # the per-row Series construction that iterrows() pays for.
+        col_pos = {col: i + 1 for i, col in enumerate(df.columns)}
+
+        def cval(row, col):
+            return row[col_pos[col]] if col else None
+
+        for row in df.itertuples(index=True, name=None):
+            idx = row[0]
             try:
-                company_id = self.safe_convert(row.get(mapping['company_id']), 'string')
-                fy_end_date = self.safe_convert(row.get(mapping['fy_end_date']), 'date')
-                fy_label = self.safe_convert(row.get(mapping['fy_label']), 'string')
+                company_id = self.safe_convert(cval(row, mapping['company_id']), 'string')
+                fy_end_date = cval(row, mapping['fy_end_date'])
+                fy_label = cval(row, mapping['fy_label'])
                 
                 if not all([company_id, fy_end_date, fy_label]):
-                    self.log(2, f"Row {idx}: Skipped (missing required fields)")
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Skipped (missing required fields)")
                     skipped_count += 1
                     continue
                 
-                try:
-                    company = Company.objects.get(company_id=company_id)
-                except Company.DoesNotExist:
-                    self.log(2, f"Row {idx}: Company {company_id} not found, skipped")
+                if company_id not in companies:
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Company {company_id} not found, skipped")
                     skipped_count += 1
                     continue
                 
-                financials, created = CompanyFinancialTimeSeries.objects.get_or_create(
-                    company=company,
+                if (company_id, fy_end_date) in pending:
+                    skipped_count += 1
+                    continue
+
+                pending[(company_id, fy_end_date)] = CompanyFinancialTimeSeries(
+                    company_id=company_id,
                     fy_end_date=fy_end_date,
-                    defaults={
-                        'fy_label': fy_label,
-                        'total_income': self.safe_convert(row.get(mapping.get('total_income')), 'float'),
-                        'pat': self.safe_convert(row.get(mapping.get('pat')), 'float'),
-                        'roa': self.safe_convert(row.get(mapping.get('roa')), 'float'),
-                        'employee_cost': self.safe_convert(row.get(mapping.get('employee_cost')), 'float'),
-                        'mcap': self.safe_convert(row.get(mapping.get('mcap')), 'float'),
-                        'employees': self.safe_convert(row.get(mapping.get('employees')), 'int'),
-                    }
+                    fy_label=fy_label,
+                    total_income=cval(row, mapping.get('total_income')),
+                    pat=cval(row, mapping.get('pat')),
+                    roa=cval(row, mapping.get('roa')),
+                    employee_cost=cval(row, mapping.get('employee_cost')),
+                    mcap=cval(row, mapping.get('mcap')),
+                    employees=self.safe_convert(cval(row, mapping.get('employees')), 'int'),
                 )
-                
-                if created:
-                    created_count += 1
-                else:
-                    skipped_count += 1
-                    
+
             except Exception as e:
-                self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
+                if self._log2:
+                    self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
                 skipped_count += 1
-        
+
+        before = CompanyFinancialTimeSeries.objects.count()
+        self.flush_pending(CompanyFinancialTimeSeries, pending.values())
+        created_count = CompanyFinancialTimeSeries.objects.count() - before
+        skipped_count += len(pending) - created_count
+
         self.stats['financial'] = {'created': created_count, 'skipped': skipped_count}
         self.log(1, f"Financial Time Series: {created_count} created, {skipped_count} skipped")
     
@@ -574,49 +878,73 @@ class ExcelDataLoader:
         required = ['company_id', 'peer_company_id', 'peer_position']
         if not all(mapping.get(field) for field in required):
             raise CommandError(f"Peer Comparisons sheet must have: {', '.join(required)}")
-        
+
+        # Both FK columns resolve against one bulk fetch over their union.
+        company_ids = {
+            self.safe_convert(v, 'string')
+            for col in (mapping['company_id'], mapping['peer_company_id'])
+            for v in df[col].dropna().unique()
+        }
+        company_ids.discard(None)
+        companies = Company.objects.in_bulk(company_ids, field_name='company_id')
+
+        # Whole-column conversion replaces the per-cell safe_convert call.
+        df = self.convert_columns(df, float_cols=[mapping.get('salary_to_median_emp_pay')])
+
+        # Unsaved instances collected per natural key and flushed in one bulk
+        # call: in-file duplicates are dropped on collection, rows already in
+        # the database are left untouched by the conflict handling.
+        pending = {}
         created_count = 0
         skipped_count = 0
         
-        for idx, row in df.iterrows():
+        # Positional handles for itertuples (index occupies slot 0); avoids
+        # the per-row Series construction that iterrows() pays for.
+        col_pos = {col: i + 1 for i, col in enumerate(df.columns)}
+
+        def cval(row, col):
+            return row[col_pos[col]] if col else None
+
+        for row in df.itertuples(index=True, name=None):
+            idx = row[0]
             try:
-                company_id = self.safe_convert(row.get(mapping['company_id']), 'string')
-                peer_company_id = self.safe_convert(row.get(mapping['peer_company_id']), 'string')
-                peer_position = self.safe_convert(row.get(mapping['peer_position']), 'int')
+                company_id = self.safe_convert(cval(row, mapping['company_id']), 'string')
+                peer_company_id = self.safe_convert(cval(row, mapping['peer_company_id']), 'string')
+                peer_position = self.safe_convert(cval(row, mapping['peer_position']), 'int')
                 
                 if not all([company_id, peer_company_id, peer_position]):
-                    self.log(2, f"Row {idx}: Skipped (missing required fields)")
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Skipped (missing required fields)")
                     skipped_count += 1
                     continue
                 
-                try:
-                    company = Company.objects.get(company_id=company_id)
-                    peer_company = Company.objects.get(company_id=peer_company_id)
-                except Company.DoesNotExist:
-                    self.log(2, f"Row {idx}: Company not found, skipped")
+                if company_id not in companies or peer_company_id not in companies:
+                    if self._log2:
+                        self.log(2, f"Row {idx}: Company not found, skipped")
                     skipped_count += 1
                     continue
                 
-                peer_comp, created = PeerComparison.objects.get_or_create(
-                    company=company,
-                    peer_company=peer_company,
+                if (company_id, peer_company_id, peer_position) in pending:
+                    skipped_count += 1
+                    continue
+
+                pending[(company_id, peer_company_id, peer_position)] = PeerComparison(
+                    company_id=company_id,
+                    peer_company_id=peer_company_id,
                     peer_position=peer_position,
-                    defaults={
-                        'salary_to_median_emp_pay': self.safe_convert(
-                            row.get(mapping.get('salary_to_median_emp_pay')), 'float'
-                        ),
-                    }
+                    salary_to_median_emp_pay=cval(row, mapping.get('salary_to_median_emp_pay')),
                 )
-                
-                if created:
-                    created_count += 1
-                else:
-                    skipped_count += 1
-                    
+
             except Exception as e:
-                self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
+                if self._log2:
+                    self.log(2, f"Row {idx}: Error - {str(e)[:100]}")
                 skipped_count += 1
-        
+
+        before = PeerComparison.objects.count()
+        self.flush_pending(PeerComparison, pending.values())
+        created_count = PeerComparison.objects.count() - before
+        skipped_count += len(pending) - created_count
+
         self.stats['peer_comparisons'] = {'created': created_count, 'skipped': skipped_count}
         self.log(1, f"Peer Comparisons: {created_count} created, {skipped_count} skipped")
     
@@ -626,7 +954,7 @@ class ExcelDataLoader:
             raise CommandError(f"File not found: {self.filepath}")
         
         self.log(1, f"Reading: {self.filepath}")
-        xls = pd.ExcelFile(self.filepath)
+        xls = pd.ExcelFile(self.filepath, engine='calamine')
         sheets = xls.sheet_names
         self.log(1, f"Found sheets: {', '.join(sheets)}")
         
@@ -637,24 +965,17 @@ class ExcelDataLoader:
                 self.log(1, f"⚠️  Sheet '{sheet}' not found, skipping")
                 continue
             
-            df = pd.read_excel(self.filepath, sheet_name=sheet)
+            # Parse from the already-open workbook handle instead of paying
+            # the zip/XML open cost again per sheet (engine comes from xls).
+            df = xls.parse(sheet)
             self.log(1, f"\nSheet: '{sheet}' ({len(df)} rows, {len(df.columns)} columns)")
             
             sheet_lower = sheet.lower().strip()
             
-            # Check for consolidated Dir Consol sheet first
-            if 'dir consol' in sheet_lower or 'dir_consol' in sheet_lower:
-                self.load_dir_consol_sheet(df)
-            elif 'company' in sheet_lower and 'director' not in sheet_lower:
-                self.load_companies(df)
-            elif 'director' in sheet_lower and 'remuneration' not in sheet_lower:
-                self.load_directors(df)
-            elif 'remuneration' in sheet_lower or 'compensation' in sheet_lower:
-                self.load_director_remuneration(df)
-            elif 'financial' in sheet_lower or 'finance' in sheet_lower:
-                self.load_financial_data(df)
-            elif 'peer' in sheet_lower:
-                self.load_peer_comparisons(df)
+            for pattern, handler in self._dispatch:
+                if pattern.search(sheet_lower):
+                    handler(df)
+                    break
             else:
                 self.log(1, f"⚠️  Unknown sheet type: '{sheet}', skipping")
 
@@ -675,8 +996,29 @@ class Command(BaseCommand):
             type=str,
             help='Specific sheet to load (if not specified, loads all sheets)'
         )
+        parser.add_argument(
+            '--fresh-load',
+            action='store_true',
+            help='Drop secondary indexes before loading and recreate them after '
+                 '(faster for full-dataset loads; unique constraints are kept)'
+        )
+
+    # Secondary (Meta.indexes) indexes are pure write overhead during a bulk
+    # load; unique constraints stay in place so conflict handling keeps working.
+    INDEXED_MODELS = [Company, Director, DirectorRemuneration, CompanyFinancialTimeSeries, PeerComparison]
+
+    def _drop_secondary_indexes(self):
+        with connection.schema_editor() as editor:
+            for model in self.INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    editor.remove_index(model, index)
+
+    def _recreate_secondary_indexes(self):
+        with connection.schema_editor() as editor:
+            for model in self.INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    editor.add_index(model, index)
 
-    @transaction.atomic
     def handle(self, *args, **options):
         filepath = options['filepath']
         sheet_name = options.get('sheet')
@@ -684,7 +1026,17 @@ class Command(BaseCommand):
         
         try:
             loader = ExcelDataLoader(filepath, verbosity=verbosity)
-            loader.load_file(sheet_name=sheet_name)
+            # The DDL runs outside the data transaction (SQLite's schema
+            # editor refuses to work inside one); the finally block puts the
+            # indexes back even if the load itself rolls back.
+            if options['fresh_load']:
+                self._drop_secondary_indexes()
+            try:
+                with transaction.atomic():
+                    loader.load_file(sheet_name=sheet_name)
+            finally:
+                if options['fresh_load']:
+                    self._recreate_secondary_indexes()
             
             self.stdout.write(self.style.SUCCESS('\n✅ Data loading completed!'))
             
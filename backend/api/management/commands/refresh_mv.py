@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = 'Refresh the mv_company_pay_rollup materialized view (run after ingesting data, or from cron).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--blocking', action='store_true',
+            help='Refresh without CONCURRENTLY (faster, but blocks readers; '
+                 'required for the first refresh of an empty view)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Materialized views require PostgreSQL; the current database is '
+                               f'{connection.vendor}.')
+        concurrently = '' if options['blocking'] else 'CONCURRENTLY '
+        with connection.cursor() as cursor:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW {concurrently}mv_company_pay_rollup')
+        self.stdout.write(self.style.SUCCESS('Refreshed mv_company_pay_rollup.'))
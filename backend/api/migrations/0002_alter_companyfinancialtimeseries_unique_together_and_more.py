@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-09-01 15:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='companyfinancialtimeseries',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='director',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='directorremuneration',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='peercomparison',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='companyfinancialtimeseries',
+            constraint=models.UniqueConstraint(fields=('company', 'fy_end_date'), name='uq_fin_company_fy'),
+        ),
+        migrations.AddConstraint(
+            model_name='director',
+            constraint=models.UniqueConstraint(fields=('director_id', 'company'), name='uq_director_id_company'),
+        ),
+        migrations.AddConstraint(
+            model_name='directorremuneration',
+            constraint=models.UniqueConstraint(fields=('company', 'director', 'fy_end_date'), name='uq_remun_company_director_fy'),
+        ),
+        migrations.AddConstraint(
+            model_name='peercomparison',
+            constraint=models.UniqueConstraint(fields=('company', 'peer_company', 'peer_position'), name='uq_peer_company_position'),
+        ),
+    ]
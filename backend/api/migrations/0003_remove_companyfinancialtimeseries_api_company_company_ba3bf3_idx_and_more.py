@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-09-01 15:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_companyfinancialtimeseries_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='companyfinancialtimeseries',
+            name='api_company_company_ba3bf3_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='directorremuneration',
+            name='api_directo_company_1e54a7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='directorremuneration',
+            name='api_directo_directo_08b5b3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='companyfinancialtimeseries',
+            index=models.Index(fields=['company', 'fy_end_date'], include=('total_income', 'pat', 'mcap', 'employees'), name='fin_comp_fy_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='directorremuneration',
+            index=models.Index(fields=['company', 'fy_end_date'], include=('total_remuneration', 'pay_excl_esops', 'esops'), name='dr_comp_fy_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='directorremuneration',
+            index=models.Index(fields=['director', 'fy_end_date'], include=('total_remuneration',), name='dr_dir_fy_cov'),
+        ),
+    ]
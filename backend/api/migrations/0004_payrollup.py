@@ -0,0 +1,69 @@
+# Generated by Django 4.2.7 on 2026-09-01 15:37
+
+from django.db import migrations, models
+
+# Materialized view backing the unmanaged PayRollup model. PostgreSQL only;
+# the unique index lets REFRESH MATERIALIZED VIEW CONCURRENTLY work.
+CREATE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW mv_company_pay_rollup AS
+SELECT
+    c.company_id,
+    c.sector,
+    c.industry,
+    f.fy_label,
+    f.fy_end_date,
+    SUM(r.total_remuneration) AS total_pay,
+    AVG(r.total_remuneration) AS avg_pay,
+    COUNT(r.id) AS n_directors,
+    f.pat,
+    f.mcap
+FROM api_company c
+JOIN api_companyfinancialtimeseries f ON f.company_id = c.company_id
+LEFT JOIN api_directorremuneration r
+    ON r.company_id = c.company_id AND r.fy_end_date = f.fy_end_date
+GROUP BY c.company_id, c.sector, c.industry, f.fy_label, f.fy_end_date, f.pat, f.mcap;
+CREATE UNIQUE INDEX uq_mv_pay_rollup_company_fy ON mv_company_pay_rollup (company_id, fy_end_date);
+CREATE INDEX ix_mv_pay_rollup_sector_fy ON mv_company_pay_rollup (sector, fy_end_date);
+"""
+
+DROP_VIEW_SQL = "DROP MATERIALIZED VIEW IF EXISTS mv_company_pay_rollup;"
+
+
+def create_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_VIEW_SQL)
+
+
+def drop_view(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_VIEW_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_remove_companyfinancialtimeseries_api_company_company_ba3bf3_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayRollup',
+            fields=[
+                ('company_id', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('sector', models.CharField(blank=True, max_length=128, null=True)),
+                ('industry', models.CharField(blank=True, max_length=128, null=True)),
+                ('fy_label', models.CharField(max_length=16)),
+                ('fy_end_date', models.DateField()),
+                ('total_pay', models.FloatField(blank=True, null=True)),
+                ('avg_pay', models.FloatField(blank=True, null=True)),
+                ('n_directors', models.IntegerField()),
+                ('pat', models.FloatField(blank=True, null=True)),
+                ('mcap', models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'mv_company_pay_rollup',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_view, drop_view),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-09-01 15:41
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_remove_customuser_api_customu_email_3ba3be_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='companyfinancialtimeseries',
+            name='company',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='financial_timeseries', to='api.company'),
+        ),
+        migrations.AlterField(
+            model_name='directorremuneration',
+            name='company',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='director_remunerations', to='api.company'),
+        ),
+        migrations.AlterField(
+            model_name='directorremuneration',
+            name='director',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='remunerations', to='api.director'),
+        ),
+    ]
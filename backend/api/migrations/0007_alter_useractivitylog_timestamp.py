@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-09-01 15:42
+
+from django.db import migrations, models
+
+
+# BRIN suits the append-only timestamp: a few KB of min/max-per-page-range
+# metadata covers the whole table for "recent activity" range scans.
+# PostgreSQL only; other backends keep just the composite B-trees.
+def create_brin(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX useractivitylog_ts_brin ON api_useractivitylog '
+            'USING BRIN (timestamp) WITH (pages_per_range=32)'
+        )
+
+
+def drop_brin(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS useractivitylog_ts_brin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_alter_companyfinancialtimeseries_company_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='useractivitylog',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.RunPython(create_brin, drop_brin),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-09-01 15:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_alter_useractivitylog_timestamp'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='company',
+            name='api_company_sector_4a412e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='company',
+            name='api_company_industr_47505d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='company',
+            name='api_company_name_35e8e7_idx',
+        ),
+    ]
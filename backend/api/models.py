@@ -12,6 +12,7 @@ Models:
 """
 
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
 
@@ -20,6 +21,21 @@ from django.utils import timezone
 # AUTHENTICATION & USER MANAGEMENT
 # ============================================================================
 
+# Data types each subscription tier may query (checked by the HasDataAccess
+# permission on every gated request, so these are precomputed frozensets
+# rather than lists rebuilt per call).
+_EMPTY_ACCESS = frozenset()
+_FREE_ACCESS = frozenset({'companies', 'directors'})
+_SUBSCRIBER_ACCESS = _FREE_ACCESS | frozenset({'remuneration', 'financials', 'peer_comparisons'})
+_ACCESS_BY_TIER = {
+    'user': _FREE_ACCESS,
+    'subscriber': _SUBSCRIBER_ACCESS,
+    # Admins reach the admin panel but see the same frontend data as
+    # non-subscribers (see CustomUser docstring).
+    'admin': _FREE_ACCESS,
+}
+
+
 class CustomUser(AbstractUser):
     """
     Custom user with email-based login and role-based access control.
@@ -53,8 +69,11 @@ class CustomUser(AbstractUser):
 
     class Meta:
         ordering = ['-created_at']
+        # email is already indexed by its unique constraint; the extra index
+        # here is the functional one backing case-insensitive lookups —
+        # UPPER, because that's what Django compiles iexact to on PostgreSQL.
         indexes = [
-            models.Index(fields=['email']),
+            models.Index(Upper('email'), name='user_email_upper_idx'),
             models.Index(fields=['is_staff']),
         ]
 
@@ -69,6 +88,21 @@ class CustomUser(AbstractUser):
         """Check if user is paid subscriber"""
         return self.role == 'subscriber'
 
+    @property
+    def access_level(self):
+        """Raw role value; exposed in API responses and JWT claims."""
+        return self.role
+
+    @property
+    def full_name(self):
+        return f"{self.first_name} {self.last_name}".strip() or self.username
+
+    def has_data_access(self, data_type):
+        """Check if user's subscription tier may query the given data type"""
+        if self.is_staff or self.is_superuser:
+            return True
+        return data_type in _ACCESS_BY_TIER.get(self.subscription_type, _EMPTY_ACCESS)
+
 
 class UserActivityLog(models.Model):
     """Logs user activities for audit tracking."""
@@ -90,7 +124,10 @@ class UserActivityLog(models.Model):
     description = models.TextField(blank=True, null=True)
     ip_address = models.GenericIPAddressField(blank=True, null=True)
     user_agent = models.TextField(blank=True, null=True)
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    # No standalone B-tree: timestamps arrive in insert order, so range
+    # scans use a BRIN index (created by migration, PostgreSQL only) and
+    # per-user/per-type queries use the composite indexes below.
+    timestamp = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         ordering = ['-timestamp']
@@ -119,12 +156,9 @@ class Company(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # name/sector/industry are indexed via db_index=True on the fields;
+        # those B-trees also serve the DISTINCT sector/industry dropdowns.
         ordering = ['name']
-        indexes = [
-            models.Index(fields=['sector']),
-            models.Index(fields=['industry']),
-            models.Index(fields=['name']),
-        ]
 
     def __str__(self):
         return f"{self.name} ({self.company_id})"
@@ -149,7 +183,9 @@ class Director(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ('director_id', 'company')
+        constraints = [
+            models.UniqueConstraint(fields=['director_id', 'company'], name='uq_director_id_company'),
+        ]
         ordering = ['name']
         indexes = [
             models.Index(fields=['company']),
@@ -162,8 +198,13 @@ class Director(models.Model):
 
 class DirectorRemuneration(models.Model):
     """Director salary/compensation time-series data (one row per director per year)."""
-    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='director_remunerations')
-    director = models.ForeignKey(Director, on_delete=models.CASCADE, related_name='remunerations')
+    # company is deliberately denormalized (it always equals
+    # director.company) so company-level aggregations never join through
+    # Director. Both FKs skip their implicit single-column index: the
+    # composite (company, fy_end_date) / (director, fy_end_date) indexes
+    # below cover point lookups via their leading column.
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='director_remunerations', db_index=False)
+    director = models.ForeignKey(Director, on_delete=models.CASCADE, related_name='remunerations', db_index=False)
     fy_end_date = models.DateField(db_index=True)
     fy_label = models.CharField(max_length=16)
 
@@ -186,11 +227,26 @@ class DirectorRemuneration(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ("company", "director", "fy_end_date")
+        # Explicit constraint (in the loaders' lookup order) rather than
+        # unique_together, so conflict-handling bulk inserts target it directly.
+        constraints = [
+            models.UniqueConstraint(fields=['company', 'director', 'fy_end_date'], name='uq_remun_company_director_fy'),
+        ]
         ordering = ['-fy_end_date']
+        # include= makes the pay columns available straight from the index
+        # (index-only scans on PostgreSQL; backends without covering-index
+        # support keep the plain composite index).
         indexes = [
-            models.Index(fields=['company', 'fy_end_date']),
-            models.Index(fields=['director', 'fy_end_date']),
+            models.Index(
+                fields=['company', 'fy_end_date'],
+                include=['total_remuneration', 'pay_excl_esops', 'esops'],
+                name='dr_comp_fy_cov',
+            ),
+            models.Index(
+                fields=['director', 'fy_end_date'],
+                include=['total_remuneration'],
+                name='dr_dir_fy_cov',
+            ),
         ]
 
     def __str__(self):
@@ -199,7 +255,9 @@ class DirectorRemuneration(models.Model):
 
 class CompanyFinancialTimeSeries(models.Model):
     """Financial metrics time-series (one row per company per year)."""
-    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='financial_timeseries')
+    # No single-column index: the composite (company, fy_end_date) index
+    # below serves company point lookups through its leading column.
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='financial_timeseries', db_index=False)
     fy_end_date = models.DateField(db_index=True)
     fy_label = models.CharField(max_length=16)
 
@@ -214,11 +272,17 @@ class CompanyFinancialTimeSeries(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ("company", "fy_end_date")
+        constraints = [
+            models.UniqueConstraint(fields=['company', 'fy_end_date'], name='uq_fin_company_fy'),
+        ]
         verbose_name_plural = "Company Financial Time Series"
         ordering = ['-fy_end_date']
         indexes = [
-            models.Index(fields=['company', 'fy_end_date']),
+            models.Index(
+                fields=['company', 'fy_end_date'],
+                include=['total_income', 'pat', 'mcap', 'employees'],
+                name='fin_comp_fy_cov',
+            ),
         ]
 
     def __str__(self):
@@ -236,7 +300,9 @@ class PeerComparison(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ('company', 'peer_company', 'peer_position')
+        constraints = [
+            models.UniqueConstraint(fields=['company', 'peer_company', 'peer_position'], name='uq_peer_company_position'),
+        ]
         ordering = ['company', 'peer_position']
         indexes = [
             models.Index(fields=['company']),
@@ -244,3 +310,31 @@ class PeerComparison(models.Model):
 
     def __str__(self):
         return f"{self.company} Peer {self.peer_position}: {self.peer_company}"
+
+
+class PayRollup(models.Model):
+    """
+    Read-only view over mv_company_pay_rollup: yearly pay totals per company
+    pre-joined with financials, refreshed by `manage.py refresh_mv`.
+    PostgreSQL only — the backing materialized view is created by the
+    migration only on that backend.
+    """
+    # The view has no surrogate key; company_id is declared primary key so
+    # Django can map rows, but (company_id, fy_end_date) is the real key.
+    company_id = models.CharField(max_length=32, primary_key=True)
+    sector = models.CharField(max_length=128, blank=True, null=True)
+    industry = models.CharField(max_length=128, blank=True, null=True)
+    fy_label = models.CharField(max_length=16)
+    fy_end_date = models.DateField()
+    total_pay = models.FloatField(blank=True, null=True)
+    avg_pay = models.FloatField(blank=True, null=True)
+    n_directors = models.IntegerField()
+    pat = models.FloatField(blank=True, null=True)
+    mcap = models.FloatField(blank=True, null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'mv_company_pay_rollup'
+
+    def __str__(self):
+        return f"{self.company_id} - {self.fy_label}"
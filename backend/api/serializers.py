@@ -1,19 +1,31 @@
+import re
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.db.models import Q
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 from .models import UserActivityLog, Company, Director, DirectorRemuneration, CompanyFinancialTimeSeries, PeerComparison
 
 User = get_user_model()
 
+# Compiled once at import: the registration validators run on every request,
+# and a C-level regex scan beats a per-character Python generator.
+_HAS_DIGIT = re.compile(r'\d').search
+_HAS_LETTER = re.compile(r'[^\W\d_]').search  # any Unicode letter
+_NON_DIGITS_RE = re.compile(r'\D')
+
 
 class CustomUserSerializer(serializers.ModelSerializer):
     """
     Serializer for CustomUser model.
     Includes role information and subscription details.
     """
-    access_level = serializers.SerializerMethodField()
-    full_name = serializers.SerializerMethodField()
+    # Plain read-only fields backed by model properties; avoids the
+    # per-instance SerializerMethodField dispatch on list endpoints.
+    access_level = serializers.CharField(read_only=True)
+    full_name = serializers.CharField(read_only=True)
 
     class Meta:
         model = User
@@ -24,12 +36,6 @@ class CustomUserSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def get_access_level(self, obj):
-        return obj.role
-
-    def get_full_name(self, obj):
-        return obj.get_full_name() or obj.username
-
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
@@ -54,7 +60,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate_first_name(self, value):
         """Validate that first name has no numeric characters."""
-        if value and any(char.isdigit() for char in value):
+        if value and _HAS_DIGIT(value):
             raise serializers.ValidationError(
                 "First name cannot contain numbers."
             )
@@ -62,7 +68,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate_last_name(self, value):
         """Validate that last name has no numeric characters."""
-        if value and any(char.isdigit() for char in value):
+        if value and _HAS_DIGIT(value):
             raise serializers.ValidationError(
                 "Last name cannot contain numbers."
             )
@@ -71,7 +77,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def validate_phone_number(self, value):
         """Validate phone number is 10 digits."""
         if value:
-            digits_only = ''.join(filter(str.isdigit, value))
+            digits_only = _NON_DIGITS_RE.sub('', value)
             if len(digits_only) != 10:
                 raise serializers.ValidationError(
                     "Phone number must be 10 digits."
@@ -80,7 +86,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate_company_name(self, value):
         """Validate that company name has no numeric characters."""
-        if value and any(char.isdigit() for char in value):
+        if value and _HAS_DIGIT(value):
             raise serializers.ValidationError(
                 "Company name cannot contain numbers."
             )
@@ -88,7 +94,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate_designation(self, value):
         """Validate that designation has no numeric characters."""
-        if value and any(char.isdigit() for char in value):
+        if value and _HAS_DIGIT(value):
             raise serializers.ValidationError(
                 "Designation cannot contain numbers."
             )
@@ -96,12 +102,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate_password(self, value):
         """Validate password: min 8 characters with letters, numbers, and special characters allowed."""
-        # Check for at least one letter
-        has_letter = any(char.isalpha() for char in value)
-        # Check for at least one digit
-        has_digit = any(char.isdigit() for char in value)
-
-        if not (has_letter and has_digit):
+        if not (_HAS_LETTER(value) and _HAS_DIGIT(value)):
             raise serializers.ValidationError(
                 "Password must be at least 8 characters and contain both letters and numbers."
             )
@@ -113,21 +114,23 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
                 {"password": "Passwords do not match."}
             )
         
-        # Check email uniqueness
+        # Check email (case-insensitive, backed by the UPPER(email) index)
+        # and phone uniqueness in a single query instead of two
         email = data.get('email')
-        if User.objects.filter(email=email).exists():
-            raise serializers.ValidationError(
-                {"email": "This email address is already registered with another account. Please use a different email address."}
-            )
-        
-        # Check phone number uniqueness (only if provided)
         phone_number = data.get('phone_number')
+        condition = Q(email__iexact=email)
         if phone_number and phone_number.strip():
-            if User.objects.filter(phone_number=phone_number).exists():
+            condition |= Q(phone_number=phone_number)
+        clashes = User.objects.filter(condition).values_list('email', flat=True)
+        if clashes:
+            if any(e.lower() == email.lower() for e in clashes):
                 raise serializers.ValidationError(
-                    {"phone_number": "This phone number is already registered with another account. Please use a different phone number or leave it blank."}
+                    {"email": "This email address is already registered with another account. Please use a different email address."}
                 )
-        
+            raise serializers.ValidationError(
+                {"phone_number": "This phone number is already registered with another account. Please use a different phone number or leave it blank."}
+            )
+
         return data
 
     def create(self, validated_data):
@@ -142,7 +145,14 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         user.set_password(password)
         user.role = 'user'  # Default role for new users
         user.subscription_type = 'user'  # Default subscription
-        user.save()
+        try:
+            user.save()
+        except IntegrityError:
+            # Backstop for a concurrent registration that slipped past the
+            # uniqueness check in validate()
+            raise serializers.ValidationError(
+                {"email": "This email address is already registered with another account. Please use a different email address."}
+            )
         return user
 
 
@@ -181,45 +191,52 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         
         # Call parent's token generation
         refresh = self.get_token(user)
-        
+
+        user_payload = self._user_claims(user)
+        user_payload.update({
+            'id': user.id,
+            'username': user.email,  # Return email as username
+            'full_name': user.get_full_name() or user.email,
+            'phone_number': user.phone_number,
+            'is_staff': user.is_staff,
+            'is_superuser': user.is_superuser,
+        })
         data = {
             'refresh': str(refresh),
             'access': str(refresh.access_token),
-            'user': {
-                'id': user.id,
-                'username': user.email,  # Return email as username
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'full_name': user.get_full_name() or user.email,
-                'role': user.role,
-                'subscription_type': user.subscription_type,
-                'access_level': user.role,
-                'company_name': user.company_name,
-                'phone_number': user.phone_number,
-                'is_staff': user.is_staff,
-                'is_superuser': user.is_superuser,
-            }
+            'user': user_payload,
         }
-        
+
         return data
+
+    @staticmethod
+    def _user_claims(user):
+        """Fields shared by the token payload and the login response body."""
+        return {
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'role': user.role,
+            'subscription_type': user.subscription_type,
+            'access_level': user.role,
+            'company_name': user.company_name,
+        }
     
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
-        
-        # Add custom claims
-        token['email'] = user.email
-        token['first_name'] = user.first_name
-        token['last_name'] = user.last_name
-        token['full_name'] = user.get_full_name()
-        token['role'] = user.role
-        token['subscription_type'] = user.subscription_type
-        token['access_level'] = user.role
-        token['company_name'] = user.company_name
-        token['is_admin'] = user.is_staff or user.is_superuser
-        token['is_superuser'] = user.is_superuser
-        
+
+        # Add custom claims in one payload update, sharing the field set
+        # with the login response body (full_name is inlined from
+        # first/last to skip the method call)
+        claims = cls._user_claims(user)
+        claims.update({
+            'full_name': f"{user.first_name} {user.last_name}".strip(),
+            'is_admin': user.is_staff or user.is_superuser,
+            'is_superuser': user.is_superuser,
+        })
+        token.payload.update(claims)
+
         return token
 
 class UserActivityLogSerializer(serializers.ModelSerializer):
@@ -321,6 +338,45 @@ class PeerComparisonSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+# Hand-rolled row builders for the hot, unpaginated list endpoints:
+# ModelSerializer's per-row field dispatch dominates those responses, and a
+# plain dict literal serializes to identical JSON. Keep the key sets in
+# lockstep with the corresponding serializers above.
+
+def serialize_company_row(company):
+    """Row dict matching CompanySerializer's output."""
+    return {
+        'company_id': company.company_id,
+        'name': company.name,
+        'sector': company.sector,
+        'industry': company.industry,
+        'index': company.index,
+        'employees': company.employees,
+        'created_at': company.created_at,
+        'updated_at': company.updated_at,
+    }
+
+
+def serialize_director_row(director):
+    """Row dict matching DirectorSerializer's output (callers must
+    select_related('company') so company_name stays off the query path)."""
+    return {
+        'director_id': director.director_id,
+        'name': director.name,
+        'company': director.company_id,
+        'company_name': director.company.name,
+        'designation': director.designation,
+        'category': director.category,
+        'qualification': director.qualification,
+        'dob': director.dob,
+        'promoter_status': director.promoter_status,
+        'gender': director.gender,
+        'appointment_date': director.appointment_date,
+        'created_at': director.created_at,
+        'updated_at': director.updated_at,
+    }
+
+
 # Nested serializers for detailed company information
 
 class CompanyDetailedSerializer(serializers.ModelSerializer):
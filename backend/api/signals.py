@@ -0,0 +1,35 @@
+"""
+Cache invalidation for the company dropdown endpoints.
+
+The dropdown/sectors/industries responses are cached by CompanyViewSet;
+these receivers clear them when Company rows change in the web process
+(e.g. admin edits). Bulk loaders both bypass model signals and run in a
+separate process — with the default per-process LocMemCache they cannot
+reach the web process's cache at all — so after an ingest the cached
+responses are simply left to age out within the one-hour TTL. If a
+shared cache backend (Redis/database) is ever configured, the loaders
+could call invalidate_company_dropdown_cache() for immediate refresh.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+
+from .models import Company
+
+COMPANY_DROPDOWN_KEY = 'company:dropdown:v1'
+COMPANY_SECTORS_KEY = 'company:sectors:v1'
+COMPANY_INDUSTRIES_KEY = 'company:industries:v1'
+
+COMPANY_DROPDOWN_CACHE_KEYS = (
+    COMPANY_DROPDOWN_KEY,
+    COMPANY_SECTORS_KEY,
+    COMPANY_INDUSTRIES_KEY,
+)
+
+
+def invalidate_company_dropdown_cache(**kwargs):
+    cache.delete_many(COMPANY_DROPDOWN_CACHE_KEYS)
+
+
+post_save.connect(invalidate_company_dropdown_cache, sender=Company)
+post_delete.connect(invalidate_company_dropdown_cache, sender=Company)
@@ -16,6 +16,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
@@ -24,9 +25,13 @@ from .serializers import (
     CustomUserSerializer, UserRegistrationSerializer,
     CustomTokenObtainPairSerializer, UserActivityLogSerializer,
     CompanySerializer, DirectorSerializer, DirectorRemunerationSerializer,
-    CompanyFinancialTimeSeriesSerializer, PeerComparisonSerializer
+    CompanyFinancialTimeSeriesSerializer, PeerComparisonSerializer,
+    serialize_company_row, serialize_director_row
 )
 from .permissions import IsAdmin
+from .signals import (
+    COMPANY_DROPDOWN_KEY, COMPANY_SECTORS_KEY, COMPANY_INDUSTRIES_KEY
+)
 from .models import (
     CustomUser, UserActivityLog, Company, Director, DirectorRemuneration,
     CompanyFinancialTimeSeries, PeerComparison
@@ -36,12 +41,17 @@ User = get_user_model()
 
 
 def get_client_ip(request):
-    """Extract client IP address from request."""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
+    """Extract client IP address from request (memoized on the request,
+    since some views log more than one activity per call)."""
+    ip = getattr(request, '_cached_client_ip', None)
+    if ip is None:
+        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        if x_forwarded_for:
+            # split(',', 1): only the first (client) hop matters
+            ip = x_forwarded_for.split(',', 1)[0].strip()
+        else:
+            ip = request.META.get('REMOTE_ADDR')
+        request._cached_client_ip = ip
     return ip
 
 
@@ -58,35 +68,22 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     
     def post(self, request, *args, **kwargs):
         response = super().post(request, *args, **kwargs)
-        
-        email = request.data.get('username')  # Frontend sends email as 'username'
-        
-        if response.status_code == 200 and email:
-            try:
-                user = User.objects.get(email=email)
+
+        # The serializer already fetched the user and embedded it in the
+        # response payload, so reuse its id instead of a second SELECT by
+        # email. Failed logins never reach this point — the serializer's
+        # ValidationError propagates before a response exists.
+        if response.status_code == 200:
+            user_id = response.data.get('user', {}).get('id')
+            if user_id:
                 UserActivityLog.objects.create(
-                    user=user,
+                    user_id=user_id,
                     activity_type='login',
-                    description=f'User logged in',
+                    description='User logged in',
                     ip_address=get_client_ip(request),
                     user_agent=request.META.get('HTTP_USER_AGENT', '')
                 )
-            except User.DoesNotExist:
-                pass
-        else:
-            if email:
-                try:
-                    user = User.objects.get(email=email)
-                    UserActivityLog.objects.create(
-                        user=user,
-                        activity_type='error',
-                        description='Failed login attempt',
-                        ip_address=get_client_ip(request),
-                        user_agent=request.META.get('HTTP_USER_AGENT', '')
-                    )
-                except User.DoesNotExist:
-                    pass
-        
+
         return response
 
 
@@ -104,6 +101,15 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = CustomUserSerializer
 
+    # Exactly the columns CustomUserSerializer renders (full_name/access_level
+    # derive from these); keeps the password hash and other unused columns
+    # out of every profile/list SELECT.
+    SERIALIZED_FIELDS = (
+        'id', 'username', 'email', 'first_name', 'last_name', 'phone_number',
+        'company_name', 'designation', 'role', 'subscription_type',
+        'is_staff', 'is_superuser', 'created_at', 'updated_at',
+    )
+
     def get_permissions(self):
         if self.action in ['create', 'register']:
             return [AllowAny()]
@@ -115,9 +121,10 @@ class UserViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated()]
 
     def get_queryset(self):
+        queryset = User.objects.only(*self.SERIALIZED_FIELDS)
         if self.request.user.is_staff:
-            return User.objects.all()
-        return User.objects.filter(id=self.request.user.id)
+            return queryset
+        return queryset.filter(id=self.request.user.id)
 
     @action(detail=False, methods=['post'], permission_classes=[AllowAny])
     def register(self, request):
@@ -169,10 +176,13 @@ class UserActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['-timestamp']
 
     def get_queryset(self):
-        # Users can only see their own logs, admins can see all
+        # Users can only see their own logs, admins can see all.
+        # select_related('user') because the serializer nests user details —
+        # without it every rendered row costs an extra query.
+        queryset = UserActivityLog.objects.select_related('user')
         if self.request.user.is_staff:
-            return UserActivityLog.objects.all()
-        return UserActivityLog.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user=self.request.user)
 
     @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated])
     def log_selection(self, request):
@@ -219,27 +229,54 @@ class CompanyViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['name']
     pagination_class = None  # Will use DEFAULT from settings
 
+    def list(self, request, *args, **kwargs):
+        # Unpaginated full-table listing: hand-rolled row dicts skip
+        # ModelSerializer's per-row field dispatch (retrieve keeps the
+        # serializer for its declared read-only handling).
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response([serialize_company_row(c) for c in queryset])
+
+    # Dropdown values change only when companies are (re)loaded, so the
+    # responses are cached for an hour. signals.py clears the keys on
+    # in-process Company changes; bulk ingests run in another process and
+    # can't reach this LocMemCache, so the TTL is the staleness bound there.
     @action(detail=False, methods=['get'])
     def dropdown(self, request):
         """Get companies as dropdown list (id, name only)."""
-        companies = Company.objects.values('company_id', 'name').order_by('name')
+        companies = cache.get_or_set(
+            COMPANY_DROPDOWN_KEY,
+            lambda: list(Company.objects.values('company_id', 'name').order_by('name')),
+            3600,
+        )
         return Response(companies)
 
     @action(detail=False, methods=['get'])
     def sectors(self, request):
         """Get all unique sectors."""
-        sectors = Company.objects.filter(
-            sector__isnull=False
-        ).values_list('sector', flat=True).distinct().order_by('sector')
-        return Response({'sectors': list(sectors)})
+        sectors = cache.get_or_set(
+            COMPANY_SECTORS_KEY,
+            lambda: list(
+                Company.objects.filter(
+                    sector__isnull=False
+                ).values_list('sector', flat=True).distinct().order_by('sector')
+            ),
+            3600,
+        )
+        return Response({'sectors': sectors})
 
     @action(detail=False, methods=['get'])
     def industries(self, request):
         """Get all unique industries."""
-        industries = Company.objects.filter(
-            industry__isnull=False
-        ).values_list('industry', flat=True).distinct().order_by('industry')
-        return Response({'industries': list(industries)})
+        industries = cache.get_or_set(
+            COMPANY_INDUSTRIES_KEY,
+            lambda: list(
+                Company.objects.filter(
+                    industry__isnull=False
+                ).values_list('industry', flat=True).distinct().order_by('industry')
+            ),
+            3600,
+        )
+        return Response({'industries': industries})
 
 
 # ============================================================================
@@ -254,7 +291,8 @@ class DirectorViewSet(viewsets.ReadOnlyModelViewSet):
     - Search by name
     - Get directors by company
     """
-    queryset = Director.objects.all()
+    # company joined up front: DirectorSerializer renders company_name
+    queryset = Director.objects.select_related('company')
     serializer_class = DirectorSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -264,6 +302,12 @@ class DirectorViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['name']
     pagination_class = None
 
+    def list(self, request, *args, **kwargs):
+        # Same hand-rolled row path as CompanyViewSet.list; the class
+        # queryset's select_related('company') keeps company_name joined.
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response([serialize_director_row(d) for d in queryset])
+
     @action(detail=False, methods=['get'])
     def dropdown(self, request):
         """Get directors as dropdown list."""
@@ -295,7 +339,7 @@ class DirectorViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        directors = Director.objects.filter(company=company).order_by('name')
+        directors = Director.objects.filter(company=company).select_related('company').order_by('name')
         serializer = self.get_serializer(directors, many=True)
         
         return Response({
@@ -316,7 +360,8 @@ class DirectorRemunerationViewSet(viewsets.ReadOnlyModelViewSet):
     - Get remuneration time-series for a director
     - Get remuneration data for a company
     """
-    queryset = DirectorRemuneration.objects.all()
+    # FK names (director_name/company_name) come back in the same SELECT
+    queryset = DirectorRemuneration.objects.select_related('company', 'director')
     serializer_class = DirectorRemunerationSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -338,7 +383,7 @@ class DirectorRemunerationViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        query = DirectorRemuneration.objects.filter(director_id=director_id)
+        query = DirectorRemuneration.objects.select_related('company', 'director').filter(director_id=director_id)
         if company_id:
             query = query.filter(company_id=company_id)
         
@@ -371,7 +416,7 @@ class DirectorRemunerationViewSet(viewsets.ReadOnlyModelViewSet):
         
         remuneration = DirectorRemuneration.objects.filter(
             company=company
-        ).order_by('-fy_end_date')
+        ).select_related('company', 'director').order_by('-fy_end_date')
         serializer = self.get_serializer(remuneration, many=True)
         
         return Response({
@@ -392,7 +437,8 @@ class CompanyFinancialTimeSeriesViewSet(viewsets.ReadOnlyModelViewSet):
     - Get financial data for specific company
     - Compare financial metrics across companies
     """
-    queryset = CompanyFinancialTimeSeries.objects.all()
+    # company joined up front for the serialized company_name
+    queryset = CompanyFinancialTimeSeries.objects.select_related('company')
     serializer_class = CompanyFinancialTimeSeriesSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -423,7 +469,7 @@ class CompanyFinancialTimeSeriesViewSet(viewsets.ReadOnlyModelViewSet):
         
         financial = CompanyFinancialTimeSeries.objects.filter(
             company=company
-        ).order_by('-fy_end_date')
+        ).select_related('company').order_by('-fy_end_date')
         serializer = self.get_serializer(financial, many=True)
         
         return Response({
@@ -484,7 +530,8 @@ class PeerComparisonViewSet(viewsets.ReadOnlyModelViewSet):
     - Filter by company, peer position
     - Get peers for specific company
     """
-    queryset = PeerComparison.objects.all()
+    # both FK names are serialized, so join both companies up front
+    queryset = PeerComparison.objects.select_related('company', 'peer_company')
     serializer_class = PeerComparisonSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
@@ -512,7 +559,7 @@ class PeerComparisonViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        peers = PeerComparison.objects.filter(company=company).order_by('peer_position')
+        peers = PeerComparison.objects.filter(company=company).select_related('company', 'peer_company').order_by('peer_position')
         serializer = self.get_serializer(peers, many=True)
         
         return Response({